@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Union
 
-from ..solvers.minizinc_runner import MiniZincRunner, SolveResult
+from ..solvers.minizinc_runner import MiniZincRunner, SolveResult, shared_runner
 
 PathLike = Union[str, Path]
 
@@ -13,6 +14,18 @@ class HasToDict(Protocol):
     def to_dict(self) -> Dict[str, Any]: ...
 
 
+# Base columns of every row produced by run_batch, in CSV order.
+RESULT_COLUMNS: List[str] = [
+    "instance",
+    "problem_type",
+    "status",
+    "has_solution",
+    "objective",
+    "time_sec",
+    "timed_out",
+]
+
+
 def _instance_name(instance: Any, index: int) -> str:
     """Try to produce a readable name for an instance.
 
@@ -36,14 +49,111 @@ def _instance_name(instance: Any, index: int) -> str:
     return f"instance_{index}"
 
 
+def _solve_row(
+    runner: MiniZincRunner,
+    inst: HasToDict,
+    idx: int,
+    time_limit: Optional[float],
+    threads: Optional[int],
+    extra_metrics_fn: Optional[Callable[[HasToDict, SolveResult], Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Solve a single instance and turn the result into one CSV row."""
+    inst_name = _instance_name(inst, idx)
+    problem_type = type(inst).__name__
+
+    res: SolveResult = runner.solve_instance(inst, time_limit=time_limit, threads=threads)
+
+    if time_limit is not None:
+        timed_out = (not res.has_solution) or (res.time >= time_limit - 1e-3)
+    else:
+        timed_out = None
+
+    row: Dict[str, Any] = {
+        "instance": inst_name,
+        "problem_type": problem_type,
+        "status": res.status,
+        "has_solution": res.has_solution,
+        "objective": res.objective,
+        "time_sec": round(res.time, 6),
+        "timed_out": timed_out,
+    }
+
+    if extra_metrics_fn is not None:
+        try:
+            extra = extra_metrics_fn(inst, res)
+            if isinstance(extra, dict):
+                row.update(extra)
+        except Exception as e:
+            row["extra_metrics_error"] = str(e)
+
+    return row
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    obj = row["objective"]
+    obj_str = "-" if obj is None else f"{obj:.4g}"
+    t_str = f"{row['time_sec']:8.3f}"
+    to_str = "-" if row["timed_out"] is None else str(bool(row["timed_out"]))
+    print(
+        f"{row['instance']:35s}  "
+        f"{row['status']:20s}  "
+        f"{obj_str:>10s}  "
+        f"{t_str}  "
+        f"{to_str:>9s}"
+    )
+
+
+class _CsvRowStream:
+    """Write result rows to a CSV file as they are produced.
+
+    The columns are RESULT_COLUMNS followed by every extra key seen so far, in
+    sorted order (the same layout as save_results_csv). A row that brings a new
+    key rewrites the file with the widened header, so no value is ever dropped.
+    """
+
+    def __init__(self, path: PathLike):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._rows: List[Dict[str, Any]] = []
+        self._fieldnames: List[str] = []
+        self._f = None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._rows.append(row)
+        if self._writer is not None and row.keys() <= set(self._fieldnames):
+            self._writer.writerow(row)
+            return
+
+        # First row or a new metric key: rewrite everything with the new header.
+        if self._f is not None:
+            self._f.close()
+        all_keys: set[str] = set().union(*self._rows)
+        self._fieldnames = RESULT_COLUMNS + sorted(all_keys.difference(RESULT_COLUMNS))
+        self._f = self._path.open("w", newline="", encoding="utf-8", buffering=1 << 16)
+        self._writer = csv.DictWriter(self._f, fieldnames=self._fieldnames, restval="")
+        self._writer.writeheader()
+        self._writer.writerows(self._rows)
+
+    def close(self) -> None:
+        if self._f is None:
+            # Same as save_results_csv for an empty batch.
+            self._path.write_text("", encoding="utf-8")
+        else:
+            self._f.close()
+
+
 def run_batch(
     instances: Iterable[HasToDict],
     model_path: PathLike,
     solver_name: str,
     time_limit: Optional[float] = None,
+    *,
     threads: Optional[int] = None,
     print_progress: bool = True,
     extra_metrics_fn: Optional[Callable[[HasToDict, SolveResult], Dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    csv_path: Optional[PathLike] = None,
 ) -> List[Dict[str, Any]]:
     """
     Run a batch of experiments for the given iterable of instances and a MiniZinc model.
@@ -58,19 +168,30 @@ def run_batch(
         MiniZinc solver identifier (e.g. 'chuffed', 'gecode', 'cbc').
     time_limit:
         Time limit in seconds per instance. If None -> no time limit.
+    threads:
+        Number of solver threads per instance (passed as `processes`). Keyword-only.
     print_progress:
         Whether to print progress to stdout.
     extra_metrics_fn:
         Optional callback that extracts additional metrics from (instance, solve_result).
         Returned dict is merged into the CSV row.
+    max_workers:
+        Number of instances solved concurrently. Each solve is a separate MiniZinc
+        subprocess, so a thread pool is enough; keep `max_workers * threads` at or
+        below the number of cores. None or 1 -> solve sequentially.
+    csv_path:
+        If given, this CSV file is overwritten and each row is written to it as
+        soon as it (and every row before it) is available, so an interrupted
+        batch keeps its finished results. The columns are the same as
+        save_results_csv would write for the rows finished so far.
 
     Returns
     -------
     List[Dict[str, Any]]
-        A list of per-instance result rows.
+        A list of per-instance result rows, in the order of `instances`.
     """
     model_path = Path(model_path)
-    runner = MiniZincRunner(model_path, solver_name)
+    runner = shared_runner(model_path, solver_name)
 
     results: List[Dict[str, Any]] = []
 
@@ -89,57 +210,53 @@ def run_batch(
         print(header)
         print("-" * len(header))
 
-    for idx, inst in enumerate(instances):
-        inst_name = _instance_name(inst, idx)
-        problem_type = type(inst).__name__
+    stream = _CsvRowStream(csv_path) if csv_path is not None else None
+    try:
+        if max_workers is None or max_workers <= 1:
+            # `instances` may be a lazy generator: each one is built just before its solve.
+            for idx, inst in enumerate(instances):
+                row = _solve_row(runner, inst, idx, time_limit, threads, extra_metrics_fn)
+                results.append(row)
+                if stream is not None:
+                    stream.write(row)
+                if print_progress:
+                    _print_row(row)
+            return results
 
-        res: SolveResult = runner.solve_instance(inst, time_limit=time_limit, threads=threads)
+        # Rows are printed as solves finish, but returned (and written) in input order.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_solve_row, runner, inst, idx, time_limit, threads, extra_metrics_fn): idx
+                for idx, inst in enumerate(instances)
+            }
+            rows: List[Optional[Dict[str, Any]]] = [None] * len(futures)
+            next_to_write = 0
+            for fut in as_completed(futures):
+                row = fut.result()
+                rows[futures[fut]] = row
+                if print_progress:
+                    _print_row(row)
+                if stream is not None:
+                    while next_to_write < len(rows) and rows[next_to_write] is not None:
+                        stream.write(rows[next_to_write])
+                        next_to_write += 1
 
-        if time_limit is not None:
-            timed_out = (not res.has_solution) or (res.time >= time_limit - 1e-3)
-        else:
-            timed_out = None
-
-        row: Dict[str, Any] = {
-            "instance": inst_name,
-            "problem_type": problem_type,
-            "status": res.status,
-            "has_solution": res.has_solution,
-            "objective": res.objective,
-            "time_sec": round(res.time, 6),
-            "timed_out": timed_out,
-        }
-
-        if extra_metrics_fn is not None:
-            try:
-                extra = extra_metrics_fn(inst, res)
-                if isinstance(extra, dict):
-                    row.update(extra)
-            except Exception as e:
-                row["extra_metrics_error"] = str(e)
-
-        results.append(row)
-
-        if print_progress:
-            obj_str = "-" if res.objective is None else f"{res.objective:.4g}"
-            t_str = f"{res.time:8.3f}"
-            to_str = "-" if timed_out is None else str(bool(timed_out))
-            print(
-                f"{inst_name:35s}  "
-                f"{res.status:20s}  "
-                f"{obj_str:>10s}  "
-                f"{t_str}  "
-                f"{to_str:>9s}"
-            )
-
-    return results
-
-
-def save_results_csv(results: List[Dict[str, Any]], path: PathLike) -> None:
+        results.extend(r for r in rows if r is not None)
+        return results
+    finally:
+        if stream is not None:
+            stream.close()
+
+
+def save_results_csv(
+    results: List[Dict[str, Any]],
+    path: PathLike,
+    fieldnames: Optional[List[str]] = None,
+) -> None:
     """
     Write a list of result dictionaries to a CSV file.
 
-    - collects all keys appearing in any row
+    - collects all keys appearing in any row (unless `fieldnames` is given)
     - writes them as CSV columns (missing values become empty cells)
     """
     if not results:
@@ -149,24 +266,13 @@ def save_results_csv(results: List[Dict[str, Any]], path: PathLike) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
-    all_keys: set[str] = set()
-    for row in results:
-        all_keys.update(row.keys())
-
-    preferred_order = [
-        "instance",
-        "problem_type",
-        "status",
-        "has_solution",
-        "objective",
-        "time_sec",
-        "timed_out",
-    ]
-    remaining_keys = sorted(k for k in all_keys if k not in preferred_order)
-    fieldnames = preferred_order + remaining_keys
-
-    with p.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in results:
-            writer.writerow(row)
+    if fieldnames is None:
+        all_keys: set[str] = set().union(*results)
+        remaining_keys = sorted(all_keys.difference(RESULT_COLUMNS))
+        fieldnames = RESULT_COLUMNS + remaining_keys
+
+    # Large write buffer: the whole table is usually flushed in a few syscalls.
+    with p.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([row.get(k, "") for k in fieldnames] for row in results)
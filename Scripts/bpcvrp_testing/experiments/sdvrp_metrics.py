@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from ..instances.sdvrp_instance import SDVRPInstance
 
 
@@ -19,6 +22,14 @@ def _as_list(x: Any) -> List[Any]:
         return [x]
 
 
+@lru_cache(maxsize=32)
+def copy_customer_index(N: int, mv: int) -> np.ndarray:
+    """Customer (0-based) of each of the N * mv customer copies; read-only, shared between calls."""
+    idx = np.repeat(np.arange(N), mv)
+    idx.flags.writeable = False
+    return idx
+
+
 def compute_sdvrp_metrics(instance: SDVRPInstance, solution: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract SDVRP-specific metrics from a MiniZinc solution.
@@ -40,44 +51,43 @@ def compute_sdvrp_metrics(instance: SDVRPInstance, solution: Dict[str, Any]) ->
     mv = instance.maxVisitsPerCustomer
     nb_copies = N * mv
 
-    # Node indices in the model are 1..lastNode; lists are 0-based.
-    def node_val(arr: List[Any], node: int) -> Any:
-        return arr[node - 1]
-
-    active_copies: List[int] = [n for n in range(1, nb_copies + 1) if int(node_val(succ, n)) != n]
+    # Node indices in the model are 1..lastNode; arrays are 0-based.
+    nodes = np.arange(1, nb_copies + 1)
+    succ_arr = np.asarray(succ[:nb_copies], dtype=np.int64)
+    delivered_arr = np.asarray(delivered[:nb_copies], dtype=np.int64)
 
-    # Delivery per original customer
-    delivered_per_customer = [0] * N
-    visits_per_customer = [0] * N
+    active = succ_arr != nodes
+    n_active_copies = int(np.count_nonzero(active))
 
-    for n in active_copies:
-        c = 1 + ((n - 1) // mv)          # original customer index (1..N)
-        q = int(node_val(delivered, n))
-        if q > 0:
-            delivered_per_customer[c - 1] += q
-            visits_per_customer[c - 1] += 1
+    # Delivery per original customer (0-based customer index)
+    customer = copy_customer_index(N, mv)
+    delivering = active & (delivered_arr > 0)
+    delivered_per_customer = np.bincount(
+        customer[delivering], weights=delivered_arr[delivering], minlength=N
+    ).astype(np.int64)
+    visits_per_customer = np.bincount(customer[delivering], minlength=N)
 
-    demand_ok = all(delivered_per_customer[i] == instance.Demand[i] for i in range(N))
+    demand_ok = bool(np.array_equal(delivered_per_customer, np.asarray(instance.Demand)))
 
-    split_customers = sum(1 for v in visits_per_customer if v >= 2)
-    served_customers = sum(1 for v in visits_per_customer if v >= 1)
+    split_customers = int(np.count_nonzero(visits_per_customer >= 2))
+    served_customers = int(np.count_nonzero(visits_per_customer >= 1))
 
     # Vehicles used = those assigned to at least one active copy.
-    used_vehicles = set()
     if veh:
-        for n in active_copies:
-            used_vehicles.add(int(node_val(veh, n)))
-    n_used_vehicles = len(used_vehicles)
+        veh_arr = np.asarray(veh[:nb_copies], dtype=np.int64)
+        n_used_vehicles = int(np.unique(veh_arr[active]).size)
+    else:
+        n_used_vehicles = 0
 
     return {
         "sd_metrics_available": True,
-        "n_active_copies": len(active_copies),
+        "n_active_copies": n_active_copies,
         "n_served_customers": served_customers,
         "n_split_customers": split_customers,
-        "max_visits_customer": max(visits_per_customer) if visits_per_customer else 0,
-        "avg_visits_customer": (sum(visits_per_customer) / N) if N else 0.0,
+        "max_visits_customer": int(visits_per_customer.max()) if N else 0,
+        "avg_visits_customer": (int(visits_per_customer.sum()) / N) if N else 0.0,
         "n_used_vehicles": n_used_vehicles,
         "demand_satisfied": demand_ok,
         "total_demand": int(sum(instance.Demand)),
-        "total_delivered_active": int(sum(delivered_per_customer)),
+        "total_delivered_active": int(delivered_per_customer.sum()),
     }
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from math import ceil, floor
+from math import ceil
 from typing import List, Optional
 import random
 
+import numpy as np
+
 from ..instances.vrp_instance import VRPInstance
 from ..instances.bpcsdvrp_instance import BPCSDVRPInstance
+from .bpcvrp_generator import _pad_and_sort_desc
+from .bpp_generator import _item_size_bounds
 from .vrp_generator import generate_random_vrp
 
 
@@ -15,6 +19,12 @@ def _lb_pallets_for_customer(sizes: List[int], bin_capacity: int) -> int:
     return int(ceil(total / bin_capacity)) if total > 0 else 0
 
 
+def _lb_pallets_for_rows(rows: List[List[int]], bin_capacity: int) -> List[int]:
+    """`_lb_pallets_for_customer` for every row at once (rows hold sizes >= 1 or 0-padding)."""
+    totals = np.fromiter(map(sum, rows), dtype=np.int64, count=len(rows))
+    return (-(-totals // bin_capacity)).tolist()
+
+
 def generate_random_bpcsdvrp(
     # ----- geometry / distance part (reuses VRP generator) -----
     n_customers: int,
@@ -70,27 +80,26 @@ def generate_random_bpcsdvrp(
     # ------------------------------------------------------------
     # 1) Generate per-customer items (sizes), 0-padded later
     # ------------------------------------------------------------
-    min_size = max(1, floor(min_item_ratio * bin_capacity))
-    max_size = min(bin_capacity, ceil(max_item_ratio * bin_capacity))
-    if min_size > max_size:
-        min_size = max_size = 1
+    min_size, max_size = _item_size_bounds(bin_capacity, min_item_ratio, max_item_ratio)
+
+    # Keep the draw order: committed data/*.dzn files are reproduced from the
+    # seed, so only the per-call attribute lookup is hoisted.
+    randint = rng.randint
 
     ItemsPerCustomer: List[int] = []
     raw_sizes: List[List[int]] = []
 
     for _ in range(n_customers):
-        k = rng.randint(min_items_per_customer, max_items_per_customer)
+        k = randint(min_items_per_customer, max_items_per_customer)
         ItemsPerCustomer.append(k)
-        row = [rng.randint(min_size, max_size) for _ in range(k)]
-        row.sort(reverse=True)
-        raw_sizes.append(row)
+        raw_sizes.append([randint(min_size, max_size) for _ in range(k)])
 
     m = maxItemsPerCustomer if maxItemsPerCustomer is not None else max(ItemsPerCustomer)
     if m <= 0:
         m = 1
 
     # Lower bounds (by volume)
-    lb_pallets = [_lb_pallets_for_customer(row, bin_capacity) for row in raw_sizes]
+    lb_pallets = _lb_pallets_for_rows(raw_sizes, bin_capacity)
     total_lb = sum(lb_pallets)
 
     # ------------------------------------------------------------
@@ -123,23 +132,22 @@ def generate_random_bpcsdvrp(
         # Upper feasible LB pallets per customer under maxVisits
         max_lb_feasible = maxVisitsPerCustomer * Capacity
 
-        for c in force_idx:
-            # choose desired LB pallets: at least Capacity + split_min_extra_pallets
-            lb_min = Capacity + max(1, split_min_extra_pallets)
-            lb_max = max_lb_feasible
-            if lb_min > lb_max:
-                # cannot force a split for this capacity/visit limit; skip
-                continue
+        # choose desired LB pallets: at least Capacity + split_min_extra_pallets
+        lb_min = Capacity + max(1, split_min_extra_pallets)
+        lb_max = max_lb_feasible
 
-            desired_lb = rng.randint(lb_min, lb_max)
+        # If lb_min > lb_max we cannot force a split for this capacity/visit
+        # limit, for any customer; the loop draws nothing from rng in that case.
+        for c in (force_idx if lb_min <= lb_max else ()):
+            desired_lb = randint(lb_min, lb_max)
 
             # Pick item count; ensure we can reach desired volume
-            k = rng.randint(min_items_per_customer, max_items_per_customer)
+            k = randint(min_items_per_customer, max_items_per_customer)
             ItemsPerCustomer[c] = k
 
             # Target total size that gives exactly desired_lb by volume:
             # total in ((desired_lb-1)*binCap, desired_lb*binCap]
-            target_total = (desired_lb - 1) * bin_capacity + rng.randint(1, bin_capacity)
+            target_total = (desired_lb - 1) * bin_capacity + randint(1, bin_capacity)
 
             # Build sizes by sampling and adjusting last item
             row: List[int] = []
@@ -147,13 +155,15 @@ def generate_random_bpcsdvrp(
             for _ in range(k):
                 if total >= target_total:
                     break
-                row.append(rng.randint(min_size, max_size))
-                total += row[-1]
+                v = randint(min_size, max_size)
+                row.append(v)
+                total += v
 
             # Ensure we have exactly k items (pad with small ones if needed)
-            while len(row) < k:
-                row.append(min_size)
-                total += min_size
+            pad = k - len(row)
+            if pad > 0:
+                row.extend([min_size] * pad)
+                total += pad * min_size
 
             # Adjust last item so sum == target_total (keep within [1, bin_capacity])
             diff = total - target_total
@@ -170,25 +180,21 @@ def generate_random_bpcsdvrp(
                     if need == 0:
                         break
                 # if still need >0, we can't reach exact target; accept larger total
-            row.sort(reverse=True)
             raw_sizes[c] = row
+            lb_pallets[c] = _lb_pallets_for_customer(row, bin_capacity)
 
     # Recompute m (might have changed k's)
     m = maxItemsPerCustomer if maxItemsPerCustomer is not None else max(ItemsPerCustomer)
 
-    SizesOfItems: List[List[int]] = []
-    for k, row in zip(ItemsPerCustomer, raw_sizes):
-        r = list(row[:k])
-        if k < m:
-            r.extend([0] * (m - k))
-        SizesOfItems.append(r)
+    # Rows are sorted non-increasingly only here, together with the padding.
+    SizesOfItems: List[List[int]] = _pad_and_sort_desc(
+        [row[:k] for k, row in zip(ItemsPerCustomer, raw_sizes)], m
+    )
 
     # ------------------------------------------------------------
     # 4) Decide nbVehicles if not provided
     # ------------------------------------------------------------
-    # Use updated lower bounds after forcing splits
-    lb_pallets = [_lb_pallets_for_customer(row[:ItemsPerCustomer[i]], bin_capacity)
-                  for i, row in enumerate(SizesOfItems)]
+    # lb_pallets was updated in place for every forced customer
     total_lb = sum(lb_pallets)
 
     if nbVehicles is None:
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from math import floor, ceil
+from itertools import chain
 from typing import List, Optional
 import random
 
+import numpy as np
+
 from ..instances.vrp_instance import VRPInstance
 from ..instances.bpcvrp_instance import BPCVRPInstance
+from .bpp_generator import _item_size_bounds
 from .vrp_generator import generate_random_vrp
 
 
+def _pad_and_sort_desc(rows: List[List[int]], width: int) -> List[List[int]]:
+    """Zero-pad every row to `width` and sort it in non-increasing order.
+
+    All rows are written into one zero matrix and sorted in a single call;
+    item sizes are >= 1, so the zero padding ends up last. A row longer than
+    `width` keeps all its items (the result is then ragged).
+    """
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    full_width = max(width, int(lengths.max(initial=0)))
+    S = np.zeros((len(rows), full_width), dtype=np.int64)
+    S[np.arange(full_width)[None, :] < lengths[:, None]] = np.fromiter(
+        chain.from_iterable(rows), dtype=np.int64, count=int(lengths.sum())
+    )
+    S = -np.sort(-S, axis=1)
+    if full_width == width:
+        return S.tolist()
+    return [row[:max(k, width)] for row, k in zip(S.tolist(), lengths.tolist())]
+
+
 def generate_random_bpcvrp(
     # ----- VRP part -----
     n_customers: int,
@@ -79,27 +101,23 @@ def generate_random_bpcvrp(
     Capacity = vrp.Capacity
     Distance = vrp.Distance
 
-    min_size = max(1, floor(min_item_ratio * bin_capacity))
-    max_size = min(bin_capacity, ceil(max_item_ratio * bin_capacity))
-    if min_size > max_size:
-        min_size = max_size = 1
+    min_size, max_size = _item_size_bounds(bin_capacity, min_item_ratio, max_item_ratio)
+
+    # The draw order must stay exactly as is: committed data/*.dzn files are
+    # reproduced from the seed. Binding randint locally skips an attribute
+    # lookup per item without touching the random stream.
+    randint = rng.randint
 
-    ItemsPerCustomer: List[int] = []
-    for _ in range(N):
-        k = rng.randint(min_items_per_customer, max_items_per_customer)
-        ItemsPerCustomer.append(k)
+    ItemsPerCustomer: List[int] = [
+        randint(min_items_per_customer, max_items_per_customer) for _ in range(N)
+    ]
 
     maxItemsPerCustomer = max(ItemsPerCustomer)
 
-    SizesOfItems: List[List[int]] = []
-    for k in ItemsPerCustomer:
-        row: List[int] = [
-            rng.randint(min_size, max_size) for _ in range(k)
-        ]
-        row.sort(reverse=True)
-        if k < maxItemsPerCustomer:
-            row.extend([0] * (maxItemsPerCustomer - k))
-        SizesOfItems.append(row)
+    raw_sizes: List[List[int]] = [
+        [randint(min_size, max_size) for _ in range(k)] for k in ItemsPerCustomer
+    ]
+    SizesOfItems: List[List[int]] = _pad_and_sort_desc(raw_sizes, maxItemsPerCustomer)
 
     inst = BPCVRPInstance(
         N=N,
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import random
 from math import floor, ceil
 
 from ..instances.bpp_instance import BPPInstance
 
 
+def _item_size_bounds(capacity: int, min_ratio: float, max_ratio: float) -> Tuple[int, int]:
+    """Integer item-size range [min_size, max_size] for ratios of `capacity`.
+
+    Falls back to (1, 1) when the rounded bounds cross.
+    """
+    min_size = max(1, floor(min_ratio * capacity))
+    max_size = min(capacity, ceil(max_ratio * capacity))
+    if min_size > max_size:
+        min_size = max_size = 1
+    return min_size, max_size
+
+
 def generate_random_bpp(
     n: int,
     capacity: int,
@@ -56,11 +68,7 @@ def generate_random_bpp(
 
     rng = random.Random(seed)
 
-    min_size = max(1, floor(min_ratio * capacity))
-    max_size = min(capacity, ceil(max_ratio * capacity))
-
-    if min_size > max_size:
-        min_size = max_size = 1
+    min_size, max_size = _item_size_bounds(capacity, min_ratio, max_ratio)
 
     sizes: List[int] = [
         rng.randint(min_size, max_size) for _ in range(n)
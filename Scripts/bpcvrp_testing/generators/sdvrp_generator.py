@@ -83,18 +83,22 @@ def generate_random_sdvrp(
 
     oversized_customers = rng.sample(range(n_customers), k) if k > 0 else []
 
+    # One uniform draw per oversized customer, in order, from the seeded rng.
+    max_allowed = maxVisitsPerCustomer * vehicle_capacity
+    can_split = max_allowed > vehicle_capacity
+    uniform = rng.uniform
+
     for idx in oversized_customers:
-        target = int(round(rng.uniform(oversized_min_factor, oversized_max_factor) * vehicle_capacity))
+        target = int(round(uniform(oversized_min_factor, oversized_max_factor) * vehicle_capacity))
         if ensure_feasible:
-            target = min(target, maxVisitsPerCustomer * vehicle_capacity)
+            target = min(target, max_allowed)
         # If we can, enforce strictly > capacity
-        if target <= vehicle_capacity and (maxVisitsPerCustomer * vehicle_capacity) > vehicle_capacity:
-            target = min(vehicle_capacity + 1, maxVisitsPerCustomer * vehicle_capacity)
+        if target <= vehicle_capacity and can_split:
+            target = min(vehicle_capacity + 1, max_allowed)
         demands[idx] = max(demand_min, target)
 
     if ensure_feasible:
-        max_allowed = maxVisitsPerCustomer * vehicle_capacity
-        demands = [min(d, max_allowed) for d in demands]
+        demands = [d if d <= max_allowed else max_allowed for d in demands]
 
     total_demand = sum(demands)
     min_vehicles = max(1, ceil(total_demand / vehicle_capacity))
@@ -115,7 +119,7 @@ def generate_random_sdvrp(
         N=base.N,
         Capacity=vehicle_capacity,
         Demand=demands,
-        Distance=[list(r) for r in base.Distance],
+        Distance=base.Distance,
         nbVehicles=nbVehicles_final,
         maxVisitsPerCustomer=maxVisitsPerCustomer,
         name=name,
@@ -1,16 +1,9 @@
 from __future__ import annotations
 
 from typing import List, Tuple, Optional
-from math import sqrt
 import random
 
-from ..instances.vrp_instance import VRPInstance
-
-
-def _euc_2d(p: Tuple[float, float], q: Tuple[float, float]) -> int:
-    dx = p[0] - q[0]
-    dy = p[1] - q[1]
-    return int(sqrt(dx * dx + dy * dy) + 0.5)
+from ..instances.vrp_instance import VRPInstance, _euc_2d_matrix
 
 
 def generate_random_vrp(
@@ -91,28 +84,31 @@ def generate_random_vrp(
 
     cluster_std = cluster_std_fraction * area_size
 
+    # Coordinates are drawn one customer at a time from `rng` so that seeded
+    # instances stay reproducible; only the dispatch is hoisted out of the loop.
+    uniform, gauss, choice, random_ = rng.uniform, rng.gauss, rng.choice, rng.random
+
     def sample_uniform() -> Tuple[float, float]:
-        return (rng.uniform(0.0, area_size), rng.uniform(0.0, area_size))
+        return (uniform(0.0, area_size), uniform(0.0, area_size))
 
     def sample_clustered() -> Tuple[float, float]:
-        cx, cy = rng.choice(cluster_centers)
-        x = rng.gauss(cx, cluster_std)
-        y = rng.gauss(cy, cluster_std)
+        cx, cy = choice(cluster_centers)
+        x = gauss(cx, cluster_std)
+        y = gauss(cy, cluster_std)
         x = max(0.0, min(area_size, x))
         y = max(0.0, min(area_size, y))
         return (x, y)
 
-    coords: List[Tuple[float, float]] = []
-    for _ in range(n_customers):
-        if instance_type == "uniform":
-            coords.append(sample_uniform())
-        elif instance_type == "clustered":
-            coords.append(sample_clustered())
-        else:
-            if rng.random() < mixed_uniform_fraction:
-                coords.append(sample_uniform())
-            else:
-                coords.append(sample_clustered())
+    coords: List[Tuple[float, float]]
+    if instance_type == "uniform":
+        coords = [sample_uniform() for _ in range(n_customers)]
+    elif instance_type == "clustered":
+        coords = [sample_clustered() for _ in range(n_customers)]
+    else:
+        coords = [
+            sample_uniform() if random_() < mixed_uniform_fraction else sample_clustered()
+            for _ in range(n_customers)
+        ]
 
     demands: List[int] = [
         rng.randint(demand_min, demand_max) for _ in range(n_customers)
@@ -135,13 +131,7 @@ def generate_random_vrp(
     N = n_customers
     nodes: List[Tuple[float, float]] = [depot] + coords
 
-    distance: List[List[int]] = [[0] * (N + 1) for _ in range(N + 1)]
-    for i in range(N + 1):
-        for j in range(N + 1):
-            if i == j:
-                distance[i][j] = 0
-            else:
-                distance[i][j] = _euc_2d(nodes[i], nodes[j])
+    distance: List[List[int]] = _euc_2d_matrix(nodes)
 
     return VRPInstance(
         N=N,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 from bpcvrp_testing.instances.bpcvrp_instance import BPCVRPInstance
+from bpcvrp_testing.instances.vrp_instance import _int_rows_str
 
 
 @dataclass
@@ -39,50 +41,54 @@ class BPCSDVRPInstance:
     name: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Return a dict of input data for the BP-SDVRP MiniZinc model."""
+        """Return a dict of input data for the BP-SDVRP MiniZinc model.
+
+        Lists are shared with the instance, not copied; treat them as read-only.
+        """
         return {
             "N": self.N,
             "Capacity": self.Capacity,
-            "Distance": [list(r) for r in self.Distance],
+            "Distance": self.Distance,
 
             "nbVehicles": self.nbVehicles,
             "maxVisitsPerCustomer": self.maxVisitsPerCustomer,
 
-            "ItemsPerCustomer": list(self.ItemsPerCustomer),
+            "ItemsPerCustomer": self.ItemsPerCustomer,
             "maxItemsPerCustomer": self.maxItemsPerCustomer,
             "binCapacity": self.binCapacity,
-            "SizesOfItems": [list(r) for r in self.SizesOfItems],
+            "SizesOfItems": self.SizesOfItems,
         }
 
     def to_dzn(self) -> str:
         """Return a .dzn text compatible with the BP-SDVRP model."""
-        lines: List[str] = []
-
-        lines.append(f"N = {self.N};")
-        lines.append(f"Capacity = {self.Capacity};")
-        lines.append(f"nbVehicles = {self.nbVehicles};")
-        lines.append(f"maxVisitsPerCustomer = {self.maxVisitsPerCustomer};")
-
-        ipc_str = ", ".join(str(x) for x in self.ItemsPerCustomer)
-        lines.append(f"ItemsPerCustomer = [{ipc_str}];")
-        lines.append(f"maxItemsPerCustomer = {self.maxItemsPerCustomer};")
-        lines.append(f"binCapacity = {self.binCapacity};")
-
-        lines.append("SizesOfItems = [|")
+        buf = io.StringIO()
+        self.write_dzn(buf)
+        return buf.getvalue()
+
+    def write_dzn(self, fh: TextIO) -> None:
+        """Write the `to_dzn` text to an open text file, one line at a time."""
+        fh.write(f"N = {self.N};\n")
+        fh.write(f"Capacity = {self.Capacity};\n")
+        fh.write(f"nbVehicles = {self.nbVehicles};\n")
+        fh.write(f"maxVisitsPerCustomer = {self.maxVisitsPerCustomer};\n")
+
+        ipc_str = ", ".join(map(str, self.ItemsPerCustomer))
+        fh.write(f"ItemsPerCustomer = [{ipc_str}];\n")
+        fh.write(f"maxItemsPerCustomer = {self.maxItemsPerCustomer};\n")
+        fh.write(f"binCapacity = {self.binCapacity};\n")
+
+        fh.write("SizesOfItems = [|\n")
         for i, row in enumerate(self.SizesOfItems, start=1):
-            row_str = ", ".join(str(v) for v in row)
+            row_str = ", ".join(map(str, row))
             prefix = "  " if i == 1 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
 
-        lines.append("Distance = [|")
-        for i, row in enumerate(self.Distance):
-            row_str = ", ".join(str(d) for d in row)
+        fh.write("Distance = [|\n")
+        for i, row_str in enumerate(_int_rows_str(self.Distance)):
             prefix = "  " if i == 0 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
-
-        return "\n".join(lines) + "\n"
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
     
 
     def to_bpcvrp(self) -> BPCVRPInstance:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
+
+from .vrp_instance import _int_rows_str
 
 
 @dataclass
@@ -38,11 +41,11 @@ class BPCVRPInstance:
         return {
             "N": self.N,
             "Capacity": self.Capacity,
-            "Distance": [list(r) for r in self.Distance],
-            "ItemsPerCustomer": list(self.ItemsPerCustomer),
+            "Distance": self.Distance,
+            "ItemsPerCustomer": self.ItemsPerCustomer,
             "maxItemsPerCustomer": self.maxItemsPerCustomer,
             "binCapacity": self.binCapacity,
-            "SizesOfItems": [list(r) for r in self.SizesOfItems],
+            "SizesOfItems": self.SizesOfItems,
         }
 
 
@@ -63,29 +66,30 @@ class BPCVRPInstance:
               ...
             | ... |];
         """
-        lines: List[str] = []
+        buf = io.StringIO()
+        self.write_dzn(buf)
+        return buf.getvalue()
 
-        lines.append(f"N = {self.N};")
-        lines.append(f"Capacity = {self.Capacity};")
+    def write_dzn(self, fh: TextIO) -> None:
+        """Write the `to_dzn` text to an open text file, one line at a time."""
+        fh.write(f"N = {self.N};\n")
+        fh.write(f"Capacity = {self.Capacity};\n")
 
-        ipc_str = ", ".join(str(x) for x in self.ItemsPerCustomer)
-        lines.append(f"ItemsPerCustomer = [{ipc_str}];")
+        ipc_str = ", ".join(map(str, self.ItemsPerCustomer))
+        fh.write(f"ItemsPerCustomer = [{ipc_str}];\n")
 
-        lines.append(f"maxItemsPerCustomer = {self.maxItemsPerCustomer};")
-        lines.append(f"binCapacity = {self.binCapacity};")
+        fh.write(f"maxItemsPerCustomer = {self.maxItemsPerCustomer};\n")
+        fh.write(f"binCapacity = {self.binCapacity};\n")
 
-        lines.append("SizesOfItems = [|")
+        fh.write("SizesOfItems = [|\n")
         for i, row in enumerate(self.SizesOfItems, start=1):
-            row_str = ", ".join(str(v) for v in row)
+            row_str = ", ".join(map(str, row))
             prefix = "  " if i == 1 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
 
-        lines.append("Distance = [|")
-        for i, row in enumerate(self.Distance):
-            row_str = ", ".join(str(d) for d in row)
+        fh.write("Distance = [|\n")
+        for i, row_str in enumerate(_int_rows_str(self.Distance)):
             prefix = "  " if i == 0 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
-
-        return "\n".join(lines) + "\n"
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
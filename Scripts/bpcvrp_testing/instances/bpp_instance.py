@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
+
 
 @dataclass
 class BPPInstance:
@@ -24,18 +26,17 @@ class BPPInstance:
         if not p.is_file():
             raise FileNotFoundError(f"File not found: {p}")
 
-        # Ignore empty lines
-        raw_lines = p.read_text(encoding="utf-8").splitlines()
-        lines: List[str] = []
-        for ln in raw_lines:
-            stripped = ln.strip()
-            if not stripped:
-                continue
-            lines.append(stripped)
+        # Two header values, then the item sizes converted in one NumPy call
+        # (a malformed token raises ValueError)
+        head = p.read_text(encoding="utf-8").split(maxsplit=2)
+        n = int(head[0])
+        capacity = int(head[1])
+        body = head[2] if len(head) > 2 else ""
+        sizes_arr = np.array(body.split(), dtype=np.int64)
 
-        n = int(lines[0])
-        capacity = int(lines[1])
-        sizes = [int(x) for x in lines[2:]]
+        if sizes_arr.size != n:
+            raise ValueError(f"Expected {n} item sizes in {p}, found {sizes_arr.size}")
+        sizes = sizes_arr.tolist()
 
         return cls(n=n, capacity=capacity, sizes=sizes)
 
@@ -68,7 +69,7 @@ class BPPInstance:
         capacity = 10;
         size = [2, 4, 5, ...];
         """
-        sizes_str = ", ".join(str(s) for s in self.sizes)
+        sizes_str = ", ".join(map(str, self.sizes))
         return (
             f"n = {self.n};\n"
             f"capacity = {self.capacity};\n"
@@ -76,7 +77,7 @@ class BPPInstance:
         )
 
     def to_string(self) -> str:
-        sizes_str = ", ".join(str(s) for s in self.sizes)
+        sizes_str = ", ".join(map(str, self.sizes))
         return (
             "BPP instance\n"
             f"n         : {self.n}\n"
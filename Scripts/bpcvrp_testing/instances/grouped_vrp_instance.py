@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
+
+from .vrp_instance import _int_rows_str
 
 
 @dataclass
@@ -42,26 +45,28 @@ class GroupedVRPInstance:
             "N": self.N,
             "Capacity": self.Capacity,
             "nbVehicles": self.nbVehicles,
-            "Demand": list(self.Demand),
-            "Distance": [list(r) for r in self.Distance],
+            "Demand": self.Demand,
+            "Distance": self.Distance,
             "fixedCost": int(self.fixedCost),
         }
 
     def to_dzn(self) -> str:
-        lines: List[str] = []
-        lines.append(f"N = {self.N};")
-        lines.append(f"Capacity = {self.Capacity};")
-        lines.append(f"nbVehicles = {self.nbVehicles};")
-        lines.append(f"fixedCost = {int(self.fixedCost)};")
-
-        demand_str = ", ".join(str(d) for d in self.Demand)
-        lines.append(f"Demand = [{demand_str}];")
-
-        lines.append("Distance = [|")
-        for i, row in enumerate(self.Distance):
-            row_str = ", ".join(str(x) for x in row)
-            prefix = "  " if i == 0 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
+        buf = io.StringIO()
+        self.write_dzn(buf)
+        return buf.getvalue()
+
+    def write_dzn(self, fh: TextIO) -> None:
+        """Write the `to_dzn` text to an open text file, one line at a time."""
+        fh.write(f"N = {self.N};\n")
+        fh.write(f"Capacity = {self.Capacity};\n")
+        fh.write(f"nbVehicles = {self.nbVehicles};\n")
+        fh.write(f"fixedCost = {int(self.fixedCost)};\n")
 
-        return "\n".join(lines) + "\n"
+        demand_str = ", ".join(map(str, self.Demand))
+        fh.write(f"Demand = [{demand_str}];\n")
+
+        fh.write("Distance = [|\n")
+        for i, row_str in enumerate(_int_rows_str(self.Distance)):
+            prefix = "  " if i == 0 else "| "
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
@@ -1,10 +1,11 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
-from .vrp_instance import VRPInstance
+from .vrp_instance import VRPInstance, _int_rows_str
 
 
 @dataclass
@@ -41,11 +42,12 @@ class SDVRPInstance:
         maxVisitsPerCustomer: int,
         name: Optional[str] = None,
     ) -> "SDVRPInstance":
+        """Wrap `base` without copying; Demand and Distance are shared with it."""
         return cls(
             N=base.N,
             Capacity=base.Capacity,
-            Demand=list(base.Demand),
-            Distance=[list(r) for r in base.Distance],
+            Demand=base.Demand,
+            Distance=base.Distance,
             nbVehicles=int(nbVehicles),
             maxVisitsPerCustomer=int(maxVisitsPerCustomer),
             name=name,
@@ -55,28 +57,30 @@ class SDVRPInstance:
         return {
             "N": self.N,
             "Capacity": self.Capacity,
-            "Demand": list(self.Demand),
-            "Distance": [list(row) for row in self.Distance],
+            "Demand": self.Demand,
+            "Distance": self.Distance,
             "nbVehicles": int(self.nbVehicles),
             "maxVisitsPerCustomer": int(self.maxVisitsPerCustomer),
         }
 
     def to_dzn(self) -> str:
         """Optional helper: export as .dzn (handy for debugging)."""
-        lines: List[str] = []
-        lines.append(f"N = {self.N};")
-        lines.append(f"Capacity = {self.Capacity};")
-        lines.append(f"nbVehicles = {self.nbVehicles};")
-        lines.append(f"maxVisitsPerCustomer = {self.maxVisitsPerCustomer};")
+        buf = io.StringIO()
+        self.write_dzn(buf)
+        return buf.getvalue()
 
-        demand_str = ", ".join(str(d) for d in self.Demand)
-        lines.append(f"Demand = [{demand_str}];")
+    def write_dzn(self, fh: TextIO) -> None:
+        """Write the `to_dzn` text to an open text file, one line at a time."""
+        fh.write(f"N = {self.N};\n")
+        fh.write(f"Capacity = {self.Capacity};\n")
+        fh.write(f"nbVehicles = {self.nbVehicles};\n")
+        fh.write(f"maxVisitsPerCustomer = {self.maxVisitsPerCustomer};\n")
 
-        lines.append("Distance = [|")
-        for i, row in enumerate(self.Distance):
-            row_str = ", ".join(str(x) for x in row)
-            prefix = "  " if i == 0 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
+        demand_str = ", ".join(map(str, self.Demand))
+        fh.write(f"Demand = [{demand_str}];\n")
 
-        return "\n".join(lines) + "\n"
+        fh.write("Distance = [|\n")
+        for i, row_str in enumerate(_int_rows_str(self.Distance)):
+            prefix = "  " if i == 0 else "| "
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
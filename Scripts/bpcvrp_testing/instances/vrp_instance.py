@@ -1,16 +1,49 @@
+import io
 from dataclasses import dataclass
-from typing import List, Dict
-import math
+from typing import List, Dict, Iterable, Iterator, Sequence, Tuple, TextIO
 from pathlib import Path
 
+import numpy as np
 
-def _euc2d(p, q) -> int:
+
+_DIST_BLOCK = 256
+
+
+def _euc_2d_matrix(nodes: Sequence[Tuple[float, float]]) -> List[List[int]]:
+    """TSPLIB EUC_2D distance matrix, int(sqrt(dx^2 + dy^2) + 0.5) for every pair.
+
+    Computed with NumPy broadcasting; the floor(x + 0.5) rounding matches the
+    TSPLIB formula bit for bit (np.rint would round halves to even).
     """
-    TSPLIB EUC_2D metric
+    P = np.asarray(nodes, dtype=np.float64)
+    M = P.shape[0]
+    D = np.empty((M, M), dtype=np.int64)
+
+    # Row blocks keep the float temporaries at _DIST_BLOCK x M instead of M x M.
+    # The metric is symmetric (x_i - x_j is exactly -(x_j - x_i) in IEEE
+    # arithmetic), so each block only computes columns from its diagonal on
+    # and mirrors them into the lower triangle.
+    for i0 in range(0, M, _DIST_BLOCK):
+        i1 = min(i0 + _DIST_BLOCK, M)
+        block = P[i0:i1]
+        dx = block[:, None, 0] - P[None, i0:, 0]
+        dy = block[:, None, 1] - P[None, i0:, 1]
+        D[i0:i1, i0:] = np.floor(np.sqrt(dx * dx + dy * dy) + 0.5)
+        D[i1:, i0:i1] = D[i0:i1, i1:].T
+    return D.tolist()
+
+
+def _int_rows_str(rows: Iterable[Sequence[int]]) -> Iterator[str]:
+    """Yield each row of an int matrix as "a, b, c".
+
+    Distance matrices repeat the same few values many times, so each distinct
+    value is converted with str() once and looked up from then on.
     """
-    dx = p[0] - q[0]
-    dy = p[1] - q[1]
-    return int(math.sqrt(dx * dx + dy * dy) + 0.5)
+    cache: Dict[int, str] = {}
+    for row in rows:
+        for v in set(row).difference(cache):
+            cache[v] = str(v)
+        yield ", ".join(map(cache.__getitem__, row))
 
 
 @dataclass
@@ -66,26 +99,28 @@ class VRPInstance:
         dimension: int | None = None
         capacity: int | None = None
 
-        coords: Dict[int, tuple[float, float]] = {}
-        demands_by_id: Dict[int, int] = {}
+        coord_lines: List[str] = []
+        demand_lines: List[str] = []
         depot_ids: List[int] = []
 
         section: str | None = None
 
-        with path_obj.open("r", encoding="utf-8") as f:
-            for raw_line in f:
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                if ":" in line and section is None:
-                    key, val = [s.strip() for s in line.split(":", 1)]
-                    if key.upper() == "DIMENSION":
-                        dimension = int(val)
-                    elif key.upper() == "CAPACITY":
-                        capacity = int(val)
-                    continue
-
+        # One read for the whole file, then a pass over the lines in memory
+        for raw_line in path_obj.read_text(encoding="utf-8").splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if ":" in line and section is None:
+                key, val = [s.strip() for s in line.split(":", 1)]
+                if key.upper() == "DIMENSION":
+                    dimension = int(val)
+                elif key.upper() == "CAPACITY":
+                    capacity = int(val)
+                continue
+
+            # Section markers are words; data rows start with a digit or sign
+            if line[0].isalpha():
                 upper = line.upper()
                 if upper.startswith("NODE_COORD_SECTION"):
                     section = "coords"
@@ -100,31 +135,25 @@ class VRPInstance:
                     section = None
                     break
 
-                if section == "coords":
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        idx = int(parts[0])
-                        x = float(parts[1])
-                        y = float(parts[2])
-                        coords[idx] = (x, y)
-                elif section == "demand":
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        idx = int(parts[0])
-                        dem = int(parts[1])
-                        demands_by_id[idx] = dem
-                elif section == "depot":
-                    if line == "-1":
-                        section = None
-                    else:
-                        depot_ids.append(int(line))
+            if section == "coords":
+                coord_lines.append(line)
+            elif section == "demand":
+                demand_lines.append(line)
+            elif section == "depot":
+                if line == "-1":
+                    section = None
+                else:
+                    depot_ids.append(int(line))
 
+        # Numeric sections are parsed in bulk: "id x y" and "id demand" rows.
+        coord_rows = np.loadtxt(coord_lines, dtype=np.float64, usecols=(0, 1, 2), ndmin=2)
+        demand_rows = np.loadtxt(demand_lines, dtype=np.int64, usecols=(0, 1), ndmin=2)
 
         if depot_ids:
             depot_id = depot_ids[0]
         else:
-            depot_candidates = [i for i, d in demands_by_id.items() if d == 0]
-            depot_id = depot_candidates[0]
+            depot_candidates = demand_rows[demand_rows[:, 1] == 0, 0]
+            depot_id = int(depot_candidates[0])
 
         dim = dimension
         N = dim - 1
@@ -132,22 +161,22 @@ class VRPInstance:
         node_ids: List[int] = [depot_id] + sorted(
             i for i in range(1, dim + 1) if i != depot_id
         )
-        
-        demand: List[int] = []
-        for orig_id in node_ids[1:]:
-            demand.append(demands_by_id[orig_id])
-
-        N_plus_1 = N + 1
-        distance: List[List[int]] = [[0] * N_plus_1 for _ in range(N_plus_1)]
-
-        for i in range(N_plus_1):
-            for j in range(N_plus_1):
-                if i == j:
-                    distance[i][j] = 0
-                else:
-                    pi = coords[node_ids[i]]
-                    pj = coords[node_ids[j]]
-                    distance[i][j] = _euc2d(pi, pj)
+
+        # Lookup tables indexed by the original TSPLIB node id
+        xy_by_id = np.full((dim + 1, 2), np.nan)
+        xy_by_id[coord_rows[:, 0].astype(np.int64)] = coord_rows[:, 1:3]
+        demand_by_id = np.full(dim + 1, -1, dtype=np.int64)
+        demand_by_id[demand_rows[:, 0]] = demand_rows[:, 1]
+
+        node_xy = xy_by_id[node_ids]
+        if np.isnan(node_xy).any():
+            raise ValueError(f"Missing node coordinates in {path_obj}")
+        demand_arr = demand_by_id[node_ids[1:]]
+        if (demand_arr < 0).any():
+            raise ValueError(f"Missing customer demands in {path_obj}")
+
+        demand: List[int] = demand_arr.tolist()
+        distance: List[List[int]] = _euc_2d_matrix(node_xy)
 
         return cls(
             N=N,
@@ -164,8 +193,8 @@ class VRPInstance:
         return {
             "N": self.N,
             "Capacity": self.Capacity,
-            "Demand": list(self.Demand),
-            "Distance": [list(row) for row in self.Distance],
+            "Demand": self.Demand,
+            "Distance": self.Distance,
         }
     
     def to_ortools(self) -> Dict[str, any]:
@@ -195,24 +224,25 @@ class VRPInstance:
             | rowN
             |];
         """
+        buf = io.StringIO()
+        self.write_dzn(buf)
+        return buf.getvalue()
+
+    def write_dzn(self, fh: TextIO) -> None:
+        """Write the `to_dzn` text to an open text file, one line at a time."""
         N = self.N
         capacity = self.Capacity
         demands = self.Demand
         distance = self.Distance
 
-        lines: List[str] = []
+        fh.write(f"N = {N};\n")
+        fh.write(f"Capacity = {capacity};\n")
 
-        lines.append(f"N = {N};")
-        lines.append(f"Capacity = {capacity};")
+        demand_str = ", ".join(map(str, demands))
+        fh.write(f"Demand = [{demand_str}];\n")
 
-        demand_str = ", ".join(str(d) for d in demands)
-        lines.append(f"Demand = [{demand_str}];")
-
-        lines.append("Distance = [|")
-        for i, row in enumerate(distance):
-            row_str = ", ".join(str(x) for x in row)
+        fh.write("Distance = [|\n")
+        for i, row_str in enumerate(_int_rows_str(distance)):
             prefix = "  " if i == 0 else "| "
-            lines.append(f"{prefix}{row_str}")
-        lines.append("|];")
-
-        return "\n".join(lines) + "\n"
+            fh.write(f"{prefix}{row_str}\n")
+        fh.write("|];\n")
@@ -6,6 +6,23 @@ from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is missing
+    orjson = None
+else:
+    # Dataclasses, datetimes, numpy values and str/int/dict/list subclasses
+    # raise TypeError instead of getting orjson's own encoding.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
 
 
 # ----------------------------------------------------------------------
@@ -48,12 +65,53 @@ def result_to_dict(instance_path: Path, res: Any) -> dict[str, Any]:
     }
 
 
-def save_result_json(instance_path: Path, res: Any, out_path: Path) -> None:
+def save_result_json(
+    instance_path: Path,
+    res: Any,
+    out_path: Path,
+    run_config: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """
+    Write `res` as JSON. `run_config` (e.g. solver, threads, time_limit) is
+    stored with it so `load_result_json` can tell whether the result is reusable.
+
+    orjson is used when installed, but only for payloads the stdlib json would
+    write the same way, so the file holds the same JSON values either way
+    (only the spelling of floats and non-ASCII text may differ). Anything else
+    (NaN/inf, dataclasses, numpy values, ints wider than 64 bits) goes through
+    stdlib json as before.
+    """
     payload = result_to_dict(instance_path, res)
+    if run_config is not None:
+        payload["run_config"] = dict(run_config)
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        try:
+            data = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # a type stdlib json handles differently (or not at all)
+        else:
+            # orjson writes NaN/inf as null; those payloads need stdlib json.
+            if b"null" not in data or orjson.loads(data) == payload:
+                out_path.write_bytes(data)
+                return
     out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
+def load_result_json(path: Path, run_config: Optional[Mapping[str, Any]] = None) -> Optional[dict[str, Any]]:
+    """
+    Read back a result written by `save_result_json` (the `result_to_dict`
+    fields plus its run_config).
+
+    If `run_config` is given, returns None unless the result was saved with
+    exactly the same run_config (older files without one never match).
+    """
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if run_config is not None and payload.get("run_config") != dict(run_config):
+        return None
+    return payload
+
+
 # ----------------------------------------------------------------------
 # Printing
 # ----------------------------------------------------------------------
@@ -118,28 +176,39 @@ def plot_runtime_vs_size(
     if not results:
         return
 
-    def _plot_one(subset: Sequence[Mapping[str, Any]], plot_title: str, save_to: Path | None) -> None:
-        xs = [int(r[x_key]) for r in subset]
-        ys = [float(r[y_key]) for r in subset]
-        oks = [bool(r.get(optimal_key, False)) for r in subset]
+    figsize = (7.5, 4.5)
 
-        fig, ax = plt.subplots(figsize=(7.5, 4.5))
+    # Plots that are only saved are drawn on one pyplot-free Figure (rendered
+    # with Agg by savefig) and cleared between groups, so no GUI backend is
+    # started and no window/figure is created per plot.
+    save_fig = Figure(figsize=figsize) if out_path is not None else None
+
+    def _plot_one(subset: Sequence[Mapping[str, Any]], plot_title: str, save_to: Path | None) -> None:
+        n = len(subset)
+        xs = np.fromiter((int(r[x_key]) for r in subset), dtype=np.int64, count=n)
+        ys = np.fromiter((float(r[y_key]) for r in subset), dtype=np.float64, count=n)
+        oks = np.fromiter((bool(r.get(optimal_key, False)) for r in subset), dtype=bool, count=n)
+
+        if save_fig is not None:
+            fig = save_fig
+            fig.clear()
+            ax = fig.add_subplot()
+        else:
+            fig, ax = plt.subplots(figsize=figsize)
 
         ax.plot(xs, ys, color=THESIS_COLORS["primary"], linewidth=2, marker="o", markersize=5, label="Time")
 
-        opt_x = [x for x, ok in zip(xs, oks) if ok]
-        opt_y = [y for y, ok in zip(ys, oks) if ok]
-        non_x = [x for x, ok in zip(xs, oks) if not ok]
-        non_y = [y for y, ok in zip(ys, oks) if not ok]
+        opt_x, opt_y = xs[oks], ys[oks]
+        non_x, non_y = xs[~oks], ys[~oks]
 
-        if opt_x:
+        if opt_x.size:
             ax.scatter(
                 opt_x, opt_y,
                 color=THESIS_COLORS["accent"],
                 edgecolor=THESIS_COLORS["text"],
                 s=60, label="Optimal", zorder=3
             )
-        if non_x:
+        if non_x.size:
             ax.scatter(
                 non_x, non_y,
                 color=THESIS_COLORS["bad"],
@@ -162,7 +231,7 @@ def plot_runtime_vs_size(
             print(f"Saved plot: {save_to}")
         else:
             plt.show()
-        plt.close(fig)
+            plt.close(fig)
 
     if group_key is None:
         _plot_one(results, title, out_path)
@@ -27,5 +27,13 @@ def load_txt_vrp(path: PathLike) -> VRPInstance:
 def save_as_dzn(instance: HasToDzn, path: PathLike) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    dzn_text = instance.to_dzn()
-    p.write_text(dzn_text, encoding="utf-8")
+
+    # Instances with a Distance matrix stream their rows straight to the file
+    # instead of building the whole text in memory first.
+    write_dzn = getattr(instance, "write_dzn", None)
+    if write_dzn is None:
+        p.write_text(instance.to_dzn(), encoding="utf-8")
+        return
+
+    with p.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        write_dzn(f)
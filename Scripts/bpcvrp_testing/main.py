@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from math import ceil
+import hashlib
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+import matplotlib
 
 from bpcvrp_testing.solvers.bpcsdvrp_sequential import solve_bpcsdvrp_grouped_heuristic
 from bpcvrp_testing.io.io_utils import save_as_dzn
 from bpcvrp_testing.io.experiment_utils import (
     is_optimal,
     save_result_json,
+    load_result_json,
     print_solve_header,
     print_instance,
     print_solve_result,
@@ -18,6 +28,7 @@ from bpcvrp_testing.io.experiment_utils import (
 from bpcvrp_testing.instances.bpp_instance import BPPInstance
 from bpcvrp_testing.instances.vrp_instance import VRPInstance
 from bpcvrp_testing.instances.sdvrp_instance import SDVRPInstance
+from bpcvrp_testing.instances.bpcvrp_instance import BPCVRPInstance
 from bpcvrp_testing.instances.bpcsdvrp_instance import BPCSDVRPInstance
 
 from bpcvrp_testing.generators.bpp_generator import generate_random_bpp
@@ -25,7 +36,7 @@ from bpcvrp_testing.generators.vrp_generator import generate_random_vrp
 from bpcvrp_testing.generators.sdvrp_generator import generate_random_sdvrp
 from bpcvrp_testing.generators.bpcsdvrp_generator import generate_random_bpcsdvrp
 
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner
+from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner, SolveResult
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -34,13 +45,26 @@ MODELS_DIR = BASE_DIR / "models"
 RESULTS_DIR = BASE_DIR / "results"
 
 SOLVER_NAME = "cp-sat"
-THREADS = 24
+# CP-SAT scales up to ~8-16 workers; past that the extra LNS workers mostly
+# compete for cores, and the instances here are small.
+THREADS = min(8, os.cpu_count() or 1)
+# Seeds of one size solved concurrently (opt in with SEED_WORKERS=N). Default 1:
+# concurrent solves share memory bandwidth and turbo headroom, which skews the
+# runtime-vs-n curves the sweeps measure.
+SEED_WORKERS = max(1, int(os.environ.get("SEED_WORKERS", "1")))
+# Re-solve (n, seed) pairs even if their result JSON already exists
+FORCE_RESOLVE = os.environ.get("FORCE_RESOLVE") == "1"
 
 # Experiment controls
 TIME_LIMIT = 2 * 60 * 60         # 2 hours
+# Optional per-size budget: min(TIME_LIMIT, BASE * GROWTH**n). With BASE=None
+# every size gets the full TIME_LIMIT.
+TIME_LIMIT_BASE: Optional[float] = None
+TIME_LIMIT_GROWTH = 1.8
 REPEATS_PER_N = 5                 # 5 different seeds per size
 INSTANCE_TYPE = "uniform"
 BASE_SEED = 42
+PRINT_INSTANCES = True            # dump every instance (full matrices) before its result
 
 # Integrated-instance controls (shared by BP-CVRP and BP-CVRP-SD)
 BPCSD_MAX_VISITS = 2
@@ -65,6 +89,17 @@ def _seeds_for_n(n: int, base_seed: int = BASE_SEED, reps: int = REPEATS_PER_N)
     return [base_seed + 1000 * n + k for k in range(reps)]
 
 
+def _time_limit_for(n: int) -> float:
+    """
+    Solver time limit for size n (customers; for BPP the sweep step i, with
+    n_items = 10 * i), so small sizes do not get the whole 2 hours.
+    Falls back to TIME_LIMIT when no TIME_LIMIT_BASE is set.
+    """
+    if TIME_LIMIT_BASE is None:
+        return TIME_LIMIT
+    return min(TIME_LIMIT, TIME_LIMIT_BASE * TIME_LIMIT_GROWTH ** n)
+
+
 def _timed_out(status: object, elapsed: float, time_limit: int) -> bool:
     """
     MiniZinc/solver statuses vary a bit; we use a conservative rule:
@@ -79,6 +114,68 @@ def _timed_out(status: object, elapsed: float, time_limit: int) -> bool:
     return False
 
 
+def _job_config(run_config: dict[str, object], data_path: Path) -> dict[str, object]:
+    """
+    run_config of one job: the sweep's settings plus a hash of the instance's
+    .dzn, so a saved result is only reused for the very same instance (the
+    generators and their constants change between runs).
+    """
+    digest = hashlib.sha256(data_path.read_bytes()).hexdigest()
+    return {**run_config, "instance_sha256": digest}
+
+
+def _solve_each(
+    solve: Callable[[Any], Any],
+    jobs: Iterable[tuple[int, Any, Path, Path, dict[str, object]]],
+) -> Iterator[Any]:
+    """
+    Yield the result for every (seed, inst, data_path, result_path, config) job,
+    in order.
+
+    A job whose result JSON already exists and was saved with the same config
+    (solver, threads, time_limit, instance hash; see _job_config) is not solved
+    again; its saved result is returned instead (set FORCE_RESOLVE=1 to redo
+    everything).
+
+    With SEED_WORKERS > 1 the solves run in a thread pool (the solver itself
+    runs out of process), with at most SEED_WORKERS jobs submitted at a time.
+    A new job is only submitted once the caller asks for the next result, so
+    closing the generator (e.g. on a timeout) starts no further solves; jobs
+    not yet running are cancelled, the ones already running are waited for.
+    """
+    def run(job: tuple[int, Any, Path, Path, dict[str, object]]) -> Any:
+        _, inst, _, result_path, config = job
+        if not FORCE_RESOLVE and result_path.is_file():
+            saved = load_result_json(result_path, config)
+            if saved is not None:
+                return SolveResult(
+                    status=saved["status"],
+                    has_solution=saved["has_solution"],
+                    objective=saved["objective"],
+                    solution=saved["solution"],
+                    time=saved["time"],
+                    raw_result=saved["raw_result"],
+                )
+        return solve(inst)
+
+    if SEED_WORKERS <= 1:
+        yield from map(run, jobs)
+        return
+
+    job_iter = iter(jobs)
+    pool = ThreadPoolExecutor(max_workers=SEED_WORKERS)
+    in_flight: deque[Future[Any]] = deque(pool.submit(run, job) for job in islice(job_iter, SEED_WORKERS))
+    try:
+        while in_flight:
+            yield in_flight.popleft().result()
+            for job in islice(job_iter, 1):
+                in_flight.append(pool.submit(run, job))
+    finally:
+        for future in in_flight:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
 def _mean(values: list[float]) -> float:
     return sum(values) / len(values) if values else 0.0
 
@@ -116,267 +213,212 @@ def _aggregate_for_plot(
 
 
 # -------------------------------------------------------------------
-# BPP
+# Shared runtime-vs-size sweep
 # -------------------------------------------------------------------
-def bpp():
+@dataclass(frozen=True)
+class ExperimentSpec:
+    """
+    One runtime-vs-size sweep: REPEATS_PER_N instances per size are generated,
+    solved with `model`, saved as .dzn/.json under `folder`, and the mean
+    runtime per size is plotted.
+    """
+    label: str                                  # "VRP", ...; lowercased it prefixes file names
+    folder: str                                 # subfolder of DATA_DIR and RESULTS_DIR
+    model: str                                  # model file in MODELS_DIR
+    sizes: Sequence[int]
+    make_instance: Callable[[int, int], Any]    # (n, seed) -> instance
+    x_key: str = "n_customers"
+    xlabel: Optional[str] = None                # defaults to x_key
+    size_attr: str = "N"                        # instance field reported under x_key
+    instance_type: Optional[str] = None         # if set: tagged on runs, plots grouped by it
+    file_stem: str = "{name}_{instance_type}_n{n}_seed{seed}"
+    row_extras: Sequence[str] = ()              # instance fields copied into every run
+    budget_scale: int = 1                       # time budget uses _time_limit_for(n // budget_scale)
+
+
+def _run_experiment(spec: ExperimentSpec) -> None:
     runs: list[dict[str, object]] = []
     stop = False
 
-    for i in range(1, 11):
-        n_items = 10 * i
-        for seed in _seeds_for_n(n_items):
-            inst: BPPInstance = generate_random_bpp(
-                n=n_items,
-                capacity=100,
-                min_ratio=0.2,
-                max_ratio=0.8,
-                seed=seed,
-            )
-
-            model_path = MODELS_DIR / "bpp_002.mzn"
-            data_path = DATA_DIR / "bpp" / f"bpp_n{n_items}_c100_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
-
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
+    name = spec.label.lower()
+    runner = MiniZincRunner(MODELS_DIR / spec.model, solver_name=SOLVER_NAME)
 
-            result_path = RESULTS_DIR / "bpp" / f"bpp_n{n_items}_c100_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
-
-            runs.append({
-                "n": inst.n,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-            })
-
-            print_solve_header(f"BPP n={n_items}, seed={seed}")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
+    for n in spec.sizes:
+        time_limit = _time_limit_for(n // spec.budget_scale)
+        solve = partial(runner.solve_instance, time_limit=time_limit, threads=THREADS)
+        run_config: dict[str, object] = {"solver": SOLVER_NAME, "threads": THREADS, "time_limit": time_limit}
+        jobs: list[tuple[int, Any, Path, Path, dict[str, object]]] = []
+        for seed in _seeds_for_n(n):
+            inst = spec.make_instance(n, seed)
 
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
+            stem = spec.file_stem.format(name=name, instance_type=spec.instance_type, n=n, seed=seed)
+            data_path = DATA_DIR / spec.folder / f"{stem}.dzn"
+            save_as_dzn(inst, data_path)
+            result_path = RESULTS_DIR / spec.folder / f"{stem}.json"
+            jobs.append((seed, inst, data_path, result_path, _job_config(run_config, data_path)))
+
+        # Closing the generator on a timeout stops it from starting more seeds.
+        with closing(_solve_each(solve, jobs)) as solved:
+            for (seed, inst, data_path, result_path, config), res in zip(jobs, solved):
+                save_result_json(data_path, res, result_path, config)
+
+                run: dict[str, object] = {
+                    spec.x_key: getattr(inst, spec.size_attr),
+                    "seed": seed,
+                    "time": res.time,
+                    "optimal": is_optimal(res.status),
+                    "status": str(res.status),
+                    "has_solution": getattr(res, "has_solution", None),
+                    "objective": getattr(res, "objective", None),
+                }
+                header = f"{spec.label} n={n}, seed={seed}"
+                if spec.instance_type is not None:
+                    run["instance_type"] = spec.instance_type
+                    header += f" ({spec.instance_type})"
+                for field in spec.row_extras:
+                    run[field] = getattr(inst, field)
+                runs.append(run)
+
+                print_solve_header(header)
+                if PRINT_INSTANCES:
+                    print_instance(inst)
+                    print("-" * 50)
+                print_solve_result(res)
+
+                if _timed_out(res.status, res.time, time_limit):
+                    stop = True
+                    break
 
         if stop:
-            break 
+            break
 
-    plot_points = _aggregate_for_plot(runs, x_key="n")
+    group_key = "instance_type" if spec.instance_type is not None else None
+    plot_points = _aggregate_for_plot(runs, x_key=spec.x_key, group_key=group_key)
     plot_runtime_vs_size(
         plot_points,
-        x_key="n",
-        title="BPP runtime vs n (mean over seeds)",
-        xlabel="n (items)",
-        out_path=RESULTS_DIR / "bpp" / "bpp_n_vs_time.png",
+        x_key=spec.x_key,
+        title=f"{spec.label} runtime vs {spec.x_key} (mean over seeds)",
+        xlabel=spec.xlabel or spec.x_key,
+        out_path=RESULTS_DIR / spec.folder / f"{name}_{spec.x_key}_vs_time.png",
+        group_key=group_key,
     )
 
 
 # -------------------------------------------------------------------
-# CVRP
+# BPP
 # -------------------------------------------------------------------
-def vrp():
-    runs: list[dict[str, object]] = []
-    stop = False
-
-    for n in range(2, 10):
-        for seed in _seeds_for_n(n):
-            inst: VRPInstance = generate_random_vrp(
-                n_customers=n,
-                area_size=100.0,
-                demand_min=1,
-                demand_max=10,
-                vehicle_capacity=None,
-                vehicle_capacity_factor=1.1,
-                target_vehicles=int(n / 3) + 1,
-                instance_type=INSTANCE_TYPE,
-                seed=seed,
-            )
-
-            model_path = MODELS_DIR / "vrp_002.mzn"
-            data_path = DATA_DIR / "vrp" / f"vrp_{INSTANCE_TYPE}_n{n}_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
-
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
+def _make_bpp(n_items: int, seed: int) -> BPPInstance:
+    return generate_random_bpp(
+        n=n_items,
+        capacity=100,
+        min_ratio=0.2,
+        max_ratio=0.8,
+        seed=seed,
+    )
 
-            result_path = RESULTS_DIR / "vrp" / f"vrp_{INSTANCE_TYPE}_n{n}_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
 
-            runs.append({
-                "n_customers": inst.N,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-                "instance_type": INSTANCE_TYPE,
-            })
+def bpp():
+    _run_experiment(ExperimentSpec(
+        label="BPP",
+        folder="bpp",
+        model="bpp_002.mzn",
+        sizes=range(10, 101, 10),
+        make_instance=_make_bpp,
+        x_key="n",
+        xlabel="n (items)",
+        size_attr="n",
+        file_stem="bpp_n{n}_c100_seed{seed}",
+        budget_scale=10,
+    ))
 
-            print_solve_header(f"VRP n={n}, seed={seed} ({INSTANCE_TYPE})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
 
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
+# -------------------------------------------------------------------
+# CVRP
+# -------------------------------------------------------------------
+def _make_vrp(n: int, seed: int) -> VRPInstance:
+    return generate_random_vrp(
+        n_customers=n,
+        area_size=100.0,
+        demand_min=1,
+        demand_max=10,
+        vehicle_capacity=None,
+        vehicle_capacity_factor=1.1,
+        target_vehicles=int(n / 3) + 1,
+        instance_type=INSTANCE_TYPE,
+        seed=seed,
+    )
 
-        if stop:
-            break
 
-    plot_points = _aggregate_for_plot(runs, x_key="n_customers", group_key="instance_type")
-    plot_runtime_vs_size(
-        plot_points,
-        x_key="n_customers",
-        title="VRP runtime vs n_customers (mean over seeds)",
-        xlabel="n_customers",
-        out_path=RESULTS_DIR / "vrp" / "vrp_n_customers_vs_time.png",
-        group_key="instance_type",
-    )
+def vrp():
+    _run_experiment(ExperimentSpec(
+        label="VRP",
+        folder="vrp",
+        model="vrp_002.mzn",
+        sizes=range(2, 10),
+        make_instance=_make_vrp,
+        instance_type=INSTANCE_TYPE,
+    ))
 
 # -------------------------------------------------------------------
 # SD-CVRP with CVRP instances
 # -------------------------------------------------------------------
-def sdvrp_vs_cvrp():
-    runs: list[dict[str, object]] = []
-    stop = False
-    
-    for n in range(2, 5):
-        for seed in _seeds_for_n(n):
-            vrp: VRPInstance = generate_random_vrp(
-                n_customers=n,
-                area_size=100.0,
-                demand_min=1,
-                demand_max=10,
-                vehicle_capacity=None,
-                vehicle_capacity_factor=1.1,
-                target_vehicles=int(n / 3) + 1,
-                instance_type=INSTANCE_TYPE,
-                seed=seed,
-            )
-
-            inst = SDVRPInstance.from_vrp(vrp, nbVehicles=n, maxVisitsPerCustomer=2)
-
-            model_path = MODELS_DIR / "vrp_003_split_delivery.mzn"
-            data_path = DATA_DIR / "sdvrp_vs_cvrp" / f"sdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
-
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
-
-            result_path = RESULTS_DIR / "sdvrp_vs_cvrp" / f"sdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
+def _make_sdvrp_from_vrp(n: int, seed: int) -> SDVRPInstance:
+    vrp = _make_vrp(n, seed)
+    return SDVRPInstance.from_vrp(vrp, nbVehicles=n, maxVisitsPerCustomer=2)
 
-            runs.append({
-                "n_customers": inst.N,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-                "instance_type": INSTANCE_TYPE,
-            })
 
-            print_solve_header(f"SDVRP n={n}, seed={seed} ({INSTANCE_TYPE})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
-
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
-
-        if stop:
-            break
-
-    plot_points = _aggregate_for_plot(runs, x_key="n_customers", group_key="instance_type")
-    plot_runtime_vs_size(
-        plot_points,
-        x_key="n_customers",
-        title="SDVRP runtime vs n_customers (mean over seeds)",
-        xlabel="n_customers",
-        out_path=RESULTS_DIR / "sdvrp_vs_cvrp" / "sdvrp_n_customers_vs_time.png",
-        group_key="instance_type",
-    )
+def sdvrp_vs_cvrp():
+    _run_experiment(ExperimentSpec(
+        label="SDVRP",
+        folder="sdvrp_vs_cvrp",
+        model="vrp_003_split_delivery.mzn",
+        sizes=range(2, 5),
+        make_instance=_make_sdvrp_from_vrp,
+        instance_type=INSTANCE_TYPE,
+    ))
 
 # -------------------------------------------------------------------
 # SD-CVRP
 # -------------------------------------------------------------------
-def sdvrp():
-    runs: list[dict[str, object]] = []
-    stop = False
-
-    for n in range(2, 5):
-        for seed in _seeds_for_n(n):
-            inst: SDVRPInstance = generate_random_sdvrp(
-                n_customers=n,
-                vehicle_capacity=20,
-                demand_min=5,
-                demand_max=20,
-                maxVisitsPerCustomer=2,
-                nbVehicles=None,
-                fraction_oversized=0.30,
-                ensure_feasible=True,
-                area_size=100.0,
-                instance_type=INSTANCE_TYPE,
-                seed=seed,
-            )
-
-            model_path = MODELS_DIR / "vrp_003_split_delivery.mzn"
-            data_path = DATA_DIR / "sdvrp" / f"sdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
-
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
-
-            result_path = RESULTS_DIR / "sdvrp" / f"sdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
-
-            runs.append({
-                "n_customers": inst.N,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-                "instance_type": INSTANCE_TYPE,
-            })
-
-            print_solve_header(f"SDVRP n={n}, seed={seed} ({INSTANCE_TYPE})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
-
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
+def _make_sdvrp(n: int, seed: int) -> SDVRPInstance:
+    return generate_random_sdvrp(
+        n_customers=n,
+        vehicle_capacity=20,
+        demand_min=5,
+        demand_max=20,
+        maxVisitsPerCustomer=2,
+        nbVehicles=None,
+        fraction_oversized=0.30,
+        ensure_feasible=True,
+        area_size=100.0,
+        instance_type=INSTANCE_TYPE,
+        seed=seed,
+    )
 
-        if stop:
-            break
 
-    plot_points = _aggregate_for_plot(runs, x_key="n_customers", group_key="instance_type")
-    plot_runtime_vs_size(
-        plot_points,
-        x_key="n_customers",
-        title="SDVRP runtime vs n_customers (mean over seeds)",
-        xlabel="n_customers",
-        out_path=RESULTS_DIR / "sdvrp" / "sdvrp_n_customers_vs_time.png",
-        group_key="instance_type",
-    )
+def sdvrp():
+    _run_experiment(ExperimentSpec(
+        label="SDVRP",
+        folder="sdvrp",
+        model="vrp_003_split_delivery.mzn",
+        sizes=range(2, 5),
+        make_instance=_make_sdvrp,
+        instance_type=INSTANCE_TYPE,
+    ))
 
 
 # -------------------------------------------------------------------
 # Integrated: build ONE master BP-SD instance per (n, seed)
 # and use it for both BP-CVRP and BP-CVRP-SD.
 # -------------------------------------------------------------------
+@lru_cache(maxsize=None)
 def _generate_master_bpcsdvrp(n: int, seed: int) -> BPCSDVRPInstance:
+    """
+    Build (once per process) the master instance for (n, seed).
+
+    Cached so bpcsdvrp(), bpcvrp() and bpcsdvrp_grouped() share the very same
+    object; callers must treat it as read-only.
+    """
     max_items_cap = min(BPCSD_MAX_ITEMS_PER_CUST, BPCSD_MAX_VISITS * BPCSD_VEHICLE_CAPACITY)
 
     inst: BPCSDVRPInstance = generate_random_bpcsdvrp(
@@ -402,7 +444,7 @@ def _generate_master_bpcsdvrp(n: int, seed: int) -> BPCSDVRPInstance:
 
     # Ensure global feasibility even under worst-case "1 item = 1 pallet"
     worst_case_total_pallets = sum(inst.ItemsPerCustomer)
-    min_vehicles = max(1, int(ceil(worst_case_total_pallets / inst.Capacity)))
+    min_vehicles = max(1, -(-worst_case_total_pallets // inst.Capacity))
     if inst.nbVehicles < min_vehicles:
         inst.nbVehicles = min_vehicles
 
@@ -413,57 +455,20 @@ def bpcsdvrp():
     """
     BP-CVRP with Split Deliveries (integrated model).
     """
-    runs: list[dict[str, object]] = []
-    stop = False
-
-    for n in range(2, 5):
-        for seed in _seeds_for_n(n):
-            inst = _generate_master_bpcsdvrp(n, seed)
-
-            model_path = MODELS_DIR / "bpcvrp_002_split_deliveries.mzn"
-            data_path = DATA_DIR / "bpcsdvrp_03" / f"bpcsdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
+    _run_experiment(ExperimentSpec(
+        label="BPCSDVRP",
+        folder="bpcsdvrp_03",
+        model="bpcvrp_002_split_deliveries.mzn",
+        sizes=range(2, 5),
+        make_instance=_generate_master_bpcsdvrp,
+        instance_type=INSTANCE_TYPE,
+        row_extras=("nbVehicles",),
+    ))
 
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
-
-            result_path = RESULTS_DIR / "bpcsdvrp_03" / f"bpcsdvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
-
-            runs.append({
-                "n_customers": inst.N,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-                "instance_type": INSTANCE_TYPE,
-                "nbVehicles": inst.nbVehicles,
-            })
-
-            print_solve_header(f"BPCSDVRP n={n}, seed={seed} ({INSTANCE_TYPE})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
-
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
 
-        if stop:
-            break
-
-    # Plot mean runtime vs n (over seeds)
-    plot_points = _aggregate_for_plot(runs, x_key="n_customers", group_key="instance_type")
-    plot_runtime_vs_size(
-        plot_points,
-        x_key="n_customers",
-        title="BPCSDVRP runtime vs n_customers (mean over seeds)",
-        xlabel="n_customers",
-        out_path=RESULTS_DIR / "bpcsdvrp_03" / "bpcsdvrp_n_customers_vs_time.png",
-        group_key="instance_type",
-    )
+def _make_bpcvrp(n: int, seed: int) -> BPCVRPInstance:
+    master = _generate_master_bpcsdvrp(n, seed)
+    return master.to_bpcvrp()  # <-- same Distance + same item lists
 
 
 def bpcvrp():
@@ -472,56 +477,14 @@ def bpcvrp():
     Uses the SAME master instances as bpcsdvrp() for fair comparison.
     Some instances may be UNSAT (and that's OK to record).
     """
-    runs: list[dict[str, object]] = []
-    stop = False
-
-    for n in range(2, 5):
-        for seed in _seeds_for_n(n):
-            master = _generate_master_bpcsdvrp(n, seed)
-            inst = master.to_bpcvrp()  # <-- same Distance + same item lists
-
-            model_path = MODELS_DIR / "bpcvrp_001.mzn"
-            data_path = DATA_DIR / "bpcvrp_03" / f"bpcvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.dzn"
-            save_as_dzn(inst, data_path)
-
-            runner = MiniZincRunner(model_path, solver_name=SOLVER_NAME)
-            res = runner.solve_instance(inst, time_limit=TIME_LIMIT, threads=THREADS)
-
-            result_path = RESULTS_DIR / "bpcvrp_03" / f"bpcvrp_{INSTANCE_TYPE}_n{n}_seed{seed}.json"
-            save_result_json(data_path, res, result_path)
-
-            runs.append({
-                "n_customers": inst.N,
-                "seed": seed,
-                "time": res.time,
-                "optimal": is_optimal(res.status),
-                "status": str(res.status),
-                "has_solution": getattr(res, "has_solution", None),
-                "objective": getattr(res, "objective", None),
-                "instance_type": INSTANCE_TYPE,
-            })
-
-            print_solve_header(f"BPCVRP n={n}, seed={seed} ({INSTANCE_TYPE})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
-
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
-
-        if stop:
-            break
-
-    plot_points = _aggregate_for_plot(runs, x_key="n_customers", group_key="instance_type")
-    plot_runtime_vs_size(
-        plot_points,
-        x_key="n_customers",
-        title="BPCVRP runtime vs n_customers (mean over seeds)",
-        xlabel="n_customers",
-        out_path=RESULTS_DIR / "bpcvrp_03" / "bpcvrp_n_customers_vs_time.png",
-        group_key="instance_type",
-    )
+    _run_experiment(ExperimentSpec(
+        label="BPCVRP",
+        folder="bpcvrp_03",
+        model="bpcvrp_001.mzn",
+        sizes=range(2, 5),
+        make_instance=_make_bpcvrp,
+        instance_type=INSTANCE_TYPE,
+    ))
 
 
 def bpcsdvrp_grouped():
@@ -530,7 +493,30 @@ def bpcsdvrp_grouped():
     instance_type = INSTANCE_TYPE
     stop = False
 
+    def solve(inst: BPCSDVRPInstance):
+        return solve_bpcsdvrp_grouped_heuristic(
+            inst=inst,
+            bpp_model_path=MODELS_DIR / "bpp_002.mzn",
+            vrp_model_path=MODELS_DIR / "vrp_002.mzn",
+            solver_name="cp-sat",
+            threads=THREADS,
+            time_limit_bpp_per_customer=GROUPED_BPP_LIMIT_PER_CUSTOMER,
+            time_limit_vrp=TIME_LIMIT,
+            treat_equal_capacity_as_fixed=False,
+            fallback_bpp="items_ub",
+            # Per-customer BPPs are tiny: one CP-SAT thread each, THREADS at a time.
+            bpp_workers=THREADS,
+        )
+
+    run_config: dict[str, object] = {
+        "solver": "cp-sat",
+        "threads": THREADS,
+        "time_limit": TIME_LIMIT,
+        "time_limit_bpp_per_customer": GROUPED_BPP_LIMIT_PER_CUSTOMER,
+    }
+
     for n in range(9, 10):
+        jobs: list[tuple[int, BPCSDVRPInstance, Path, Path, dict[str, object]]] = []
         for seed in _seeds_for_n(n):
 
             inst = _generate_master_bpcsdvrp(n, seed)
@@ -541,45 +527,38 @@ def bpcsdvrp_grouped():
                 / f"bpcsdvrp_grouped_{instance_type}_n{n}_seed{seed}.dzn"
             )
             save_as_dzn(inst, data_path)
-
-            res = solve_bpcsdvrp_grouped_heuristic(
-                inst=inst,
-                bpp_model_path=MODELS_DIR / "bpp_002.mzn",
-                vrp_model_path=MODELS_DIR / "vrp_002.mzn",
-                solver_name="cp-sat",
-                threads=24,
-                time_limit_bpp_per_customer=GROUPED_BPP_LIMIT_PER_CUSTOMER,
-                time_limit_vrp=TIME_LIMIT,
-                treat_equal_capacity_as_fixed=False,
-                fallback_bpp="items_ub",
-            )
-
             result_path = (
                 RESULTS_DIR
                 / "bpcsdvrp_grouped_03"
                 / f"bpcsdvrp_grouped_{instance_type}_n{n}_seed{seed}.json"
             )
-            save_result_json(data_path, res, result_path)
-            results.append(
-                {
-                    "n_customers": n,
-                    "time": float(res.time),
-                    "optimal": False,
-                    "instance_type": instance_type,
-                    "objective": res.objective,
-                    "status": res.status,
-                    "has_solution": res.has_solution,
-                }
-            )
-
-            print_solve_header(f"BPCSDVRP grouped | n={n} | seed={seed} ({instance_type})")
-            print_instance(inst)
-            print("-" * 50)
-            print_solve_result(res)
-
-            if _timed_out(res.status, res.time, TIME_LIMIT):
-                stop = True
-                break
+            jobs.append((seed, inst, data_path, result_path, _job_config(run_config, data_path)))
+
+        # Closing the generator on a timeout stops it from starting more seeds.
+        with closing(_solve_each(solve, jobs)) as solved:
+            for (seed, inst, data_path, result_path, config), res in zip(jobs, solved):
+                save_result_json(data_path, res, result_path, config)
+                results.append(
+                    {
+                        "n_customers": n,
+                        "time": float(res.time),
+                        "optimal": False,
+                        "instance_type": instance_type,
+                        "objective": res.objective,
+                        "status": res.status,
+                        "has_solution": res.has_solution,
+                    }
+                )
+
+                print_solve_header(f"BPCSDVRP grouped | n={n} | seed={seed} ({instance_type})")
+                if PRINT_INSTANCES:
+                    print_instance(inst)
+                    print("-" * 50)
+                print_solve_result(res)
+
+                if _timed_out(res.status, res.time, TIME_LIMIT):
+                    stop = True
+                    break
 
         if stop:
             break
@@ -596,6 +575,9 @@ def bpcsdvrp_grouped():
 
 
 if __name__ == "__main__":
+    # The sweeps only save plots to disk; never start a GUI backend
+    matplotlib.use("Agg")
+
     # bpp()
     # vrp()
     # sdvrp_vs_cvrp()
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict
+
+import numpy as np
 
 from bpcvrp_testing.generators.bpcsdvrp_generator import generate_random_bpcsdvrp
 from bpcvrp_testing.io.io_utils import save_as_dzn
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner
-from bpcvrp_testing.experiments.batch_runner import run_batch, save_results_csv
+from bpcvrp_testing.solvers.minizinc_runner import shared_runner
+from bpcvrp_testing.experiments.batch_runner import run_batch
+from bpcvrp_testing.experiments.sdvrp_metrics import copy_customer_index
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = BASE_DIR / "data"
 MODELS_DIR = BASE_DIR / "models"
 RESULTS_DIR = BASE_DIR / "results"
 
+# Batch instances solved side by side; the cores are shared between them.
+PARALLEL_INSTANCES = 4
+
 
 def _sd_metrics_from_solution(N: int, maxVisitsPerCustomer: int, sol: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -32,33 +39,29 @@ def _sd_metrics_from_solution(N: int, maxVisitsPerCustomer: int, sol: Dict[str,
         return {}
 
     nb_copies = N * maxVisitsPerCustomer
-    delivered_copies: List[int] = [int(x) for x in delivered[:nb_copies]]
-
-    visits = [0] * N
-    delivered_sum = [0] * N
+    delivered_copies = np.asarray(delivered[:nb_copies], dtype=np.int64)
 
-    for idx, val in enumerate(delivered_copies, start=1):
-        if val > 0:
-            c = 1 + ((idx - 1) // maxVisitsPerCustomer)  # origCustomer
-            visits[c - 1] += 1
-            delivered_sum[c - 1] += val
+    cust = copy_customer_index(N, maxVisitsPerCustomer)[:delivered_copies.size]
+    active = delivered_copies > 0
+    visits = np.bincount(cust[active], minlength=N)
+    delivered_sum = np.bincount(cust[active], weights=delivered_copies[active], minlength=N).astype(np.int64)
 
-    n_split_customers = sum(1 for v in visits if v >= 2)
-    n_active_copies = sum(1 for v in delivered_copies if v > 0)
+    n_split_customers = int(np.count_nonzero(visits >= 2))
+    n_active_copies = int(np.count_nonzero(active))
 
     out: Dict[str, Any] = {
         "n_active_copies": n_active_copies,
         "n_split_customers": n_split_customers,
-        "max_visits_used": max(visits) if visits else 0,
-        "avg_visits_used": round(sum(visits) / N, 4) if N else 0.0,
+        "max_visits_used": int(visits.max()) if visits.size else 0,
+        "avg_visits_used": round(int(visits.sum()) / N, 4) if N else 0.0,
     }
 
     # Optional: validate demand satisfaction if Demand is present
     if isinstance(demand, list) and len(demand) == N:
-        demand_int = [int(x) for x in demand]
-        out["demand_satisfied"] = all(delivered_sum[i] == demand_int[i] for i in range(N))
-        out["max_pallet_demand"] = max(demand_int) if demand_int else 0
-        out["avg_pallet_demand"] = round(sum(demand_int) / N, 4) if N else 0.0
+        demand_arr = np.asarray(demand, dtype=np.int64)
+        out["demand_satisfied"] = bool((delivered_sum == demand_arr).all())
+        out["max_pallet_demand"] = int(demand_arr.max()) if demand_arr.size else 0
+        out["avg_pallet_demand"] = round(int(demand_arr.sum()) / N, 4) if N else 0.0
 
     return out
 
@@ -128,7 +131,7 @@ def test_2_bpcsdvrp_generate_and_solve():
     inst.name = "bpcsdvrp_n4_notimelimit"
 
     model_path = MODELS_DIR / "bpcvrp_002_split_deliveries.mzn"
-    runner = MiniZincRunner(model_path, solver_name="cp-sat")
+    runner = shared_runner(model_path, solver_name="cp-sat")
 
     res = runner.solve_instance(inst, threads=24)
 
@@ -170,21 +173,21 @@ def test_3_bpcsdvrp_batch():
         instances.append(inst)
 
     model_path = MODELS_DIR / "bpcvrp_002_split_deliveries.mzn"
-    rows = run_batch(
+    csv_path = RESULTS_DIR / "bpcsdvrp_batch_example.csv"
+    run_batch(
         instances,
         model_path=model_path,
         solver_name="cp-sat",
         time_limit=3600.0,
-        threads=24,
+        threads=max(1, (os.cpu_count() or 1) // PARALLEL_INSTANCES),
+        max_workers=PARALLEL_INSTANCES,
         print_progress=True,
+        csv_path=csv_path,
         extra_metrics_fn=lambda inst, res: _sd_metrics_from_solution(
             inst.N, inst.maxVisitsPerCustomer, res.solution or {}
         ),
     )
 
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    csv_path = RESULTS_DIR / "bpcsdvrp_batch_example.csv"
-    save_results_csv(rows, csv_path)
     print("Saved BP-SDVRP batch results to:", csv_path)
 
 
@@ -219,7 +222,7 @@ def test_4_bpcsdvrp_tiny_debug():
     print("Tiny BP-SDVRP saved to:", dzn_path)
 
     model_path = MODELS_DIR / "bpcvrp_002_split_deliveries.mzn"
-    runner = MiniZincRunner(model_path, solver_name="cp-sat")
+    runner = shared_runner(model_path, solver_name="cp-sat")
     res = runner.solve_instance(inst, time_limit=120, threads=24)
 
     print("Tiny BP-SDVRP status:", res.status)
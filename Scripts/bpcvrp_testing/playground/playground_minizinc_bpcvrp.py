@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from bpcvrp_testing.generators.bpcvrp_generator import generate_random_bpcvrp
 from bpcvrp_testing.io.io_utils import save_as_dzn
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner
-from bpcvrp_testing.experiments.batch_runner import run_batch, save_results_csv
+from bpcvrp_testing.solvers.minizinc_runner import shared_runner
+from bpcvrp_testing.experiments.batch_runner import run_batch
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -73,7 +74,7 @@ def test_2_bpcvrp_generate_and_solve():
     inst.name = "bpcvrp_n7_uniform_seed42"
 
     model_path = MODELS_DIR / "bpcvrp_001.mzn"
-    runner = MiniZincRunner(model_path, solver_name="chuffed")
+    runner = shared_runner(model_path, solver_name="chuffed")
 
     res = runner.solve_instance(inst, time_limit=300)
 
@@ -112,17 +113,18 @@ def test_3_bpcvrp_batch():
         instances.append(inst)
 
     model_path = MODELS_DIR / "bpcvrp_001.mzn"
-    rows = run_batch(
+    csv_path = RESULTS_DIR / "bpcvrp_batch_example.csv"
+    run_batch(
         instances,
         model_path=model_path,
         solver_name="chuffed",
         time_limit=600.0,
+        # Chuffed is single-threaded: one instance per core.
+        max_workers=os.cpu_count(),
         print_progress=True,
+        csv_path=csv_path,
     )
 
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    csv_path = RESULTS_DIR / "bpcvrp_batch_example.csv"
-    save_results_csv(rows, csv_path)
     print("Saved BPCVRP batch results to:", csv_path)
 
 
@@ -155,7 +157,7 @@ def test_4_bpcvrp_tiny_debug():
     print("Tiny BPCVRP saved to:", dzn_path)
 
     model_path = MODELS_DIR / "bpcvrp_001.mzn"
-    runner = MiniZincRunner(model_path, solver_name="chuffed")
+    runner = shared_runner(model_path, solver_name="chuffed")
     res = runner.solve_instance(inst, time_limit=120)
 
     print("Tiny BPCVRP status:", res.status)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import importlib.util
+import os
 from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
+
 from bpcvrp_testing.io.io_utils import save_as_dzn
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner
-from bpcvrp_testing.experiments.batch_runner import run_batch, save_results_csv
+from bpcvrp_testing.solvers.minizinc_runner import shared_runner
+from bpcvrp_testing.experiments.batch_runner import run_batch
 from bpcvrp_testing.generators.sdvrp_generator import generate_random_sdvrp
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # Scripts/
@@ -13,6 +17,9 @@ DATA_DIR = BASE_DIR / "data"
 MODELS_DIR = BASE_DIR / "models"
 RESULTS_DIR = BASE_DIR / "results"
 
+# Batch instances solved side by side; the cores are shared between them.
+PARALLEL_INSTANCES = 4
+
 
 def _fallback_compute_sdvrp_metrics(instance: Any, sol: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -34,19 +41,18 @@ def _fallback_compute_sdvrp_metrics(instance: Any, sol: Dict[str, Any]) -> Dict[
         return {}
 
     nb_copies = N * mv
-    delivered_copies = delivered[:nb_copies]  # first block is customer copies
+    # first block is customer copies; missing (None) values count as not visited
+    delivered_copies = np.array(delivered[:nb_copies], dtype=np.float64)
 
     # visits per customer: count copies with delivered > 0
-    visits = [0] * N
-    for idx, val in enumerate(delivered_copies, start=1):
-        if val and val > 0:
-            c = 1 + ((idx - 1) // mv)  # origCustomer mapping
-            visits[c - 1] += 1
+    active = delivered_copies > 0
+    customer = np.arange(delivered_copies.size) // mv
+    visits = np.bincount(customer[active], minlength=N)
 
-    n_split_customers = sum(1 for v in visits if v >= 2)
-    n_active_copies = sum(1 for v in delivered_copies if v and v > 0)
-    max_visits = max(visits) if visits else 0
-    avg_visits = (sum(visits) / N) if N else 0.0
+    n_split_customers = int(np.count_nonzero(visits >= 2))
+    n_active_copies = int(np.count_nonzero(active))
+    max_visits = int(visits.max()) if visits.size else 0
+    avg_visits = (int(visits.sum()) / N) if N else 0.0
 
     return {
         "n_active_copies": n_active_copies,
@@ -56,18 +62,15 @@ def _fallback_compute_sdvrp_metrics(instance: Any, sol: Dict[str, Any]) -> Dict[
     }
 
 
-try:
-    from bpcvrp_testing.experiments.sdvrp_metrics import compute_sdvrp_metrics  # type: ignore
-except Exception:
-    compute_sdvrp_metrics = None
+# Only a missing module selects the fallback; errors inside sdvrp_metrics propagate.
+if importlib.util.find_spec("bpcvrp_testing.experiments.sdvrp_metrics") is not None:
+    from bpcvrp_testing.experiments.sdvrp_metrics import compute_sdvrp_metrics
+else:
+    compute_sdvrp_metrics = _fallback_compute_sdvrp_metrics
 
 
 def _sd_metrics(inst: Any, res: Any) -> Dict[str, Any]:
-    if not res.solution:
-        return {}
-    if compute_sdvrp_metrics is not None:
-        return compute_sdvrp_metrics(inst, res.solution)
-    return _fallback_compute_sdvrp_metrics(inst, res.solution)
+    return compute_sdvrp_metrics(inst, res.solution) if res.solution else {}
 
 
 def test_1_sdvrp_generate_to_dzn():
@@ -116,7 +119,7 @@ def test_2_sdvrp_generate_and_solve():
     inst.name = "sdvrp_n4_seed42"
 
     model_path = MODELS_DIR / "vrp_003_split_delivery.mzn"
-    runner = MiniZincRunner(model_path, solver_name="cp-sat")
+    runner = shared_runner(model_path, solver_name="cp-sat")
 
     res = runner.solve_instance(inst, time_limit=120, threads=12)
 
@@ -150,19 +153,19 @@ def test_3_sdvrp_batch():
         instances.append(inst)
 
     model_path = MODELS_DIR / "vrp_003_split_delivery.mzn"
-    rows = run_batch(
+    csv_path = RESULTS_DIR / "sdvrp_batch_24threads.csv"
+    run_batch(
         instances,
         model_path=model_path,
         solver_name="cp-sat",
         time_limit=300.0,
-        threads=24,
+        threads=max(1, (os.cpu_count() or 1) // PARALLEL_INSTANCES),
+        max_workers=PARALLEL_INSTANCES,
         print_progress=True,
+        csv_path=csv_path,
         extra_metrics_fn=lambda inst, res: _sd_metrics(inst, res),
     )
 
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    csv_path = RESULTS_DIR / "sdvrp_batch_24threads.csv"
-    save_results_csv(rows, csv_path)
     print("Saved SDVRP batch results to:", csv_path)
 
 
@@ -190,7 +193,7 @@ def test_4_sdvrp_tiny_debug():
     print("Tiny SDVRP saved to:", dzn_path)
 
     model_path = MODELS_DIR / "vrp_003_split_delivery.mzn"
-    runner = MiniZincRunner(model_path, solver_name="chuffed")
+    runner = shared_runner(model_path, solver_name="chuffed")
     res = runner.solve_instance(inst, time_limit=120)
 
     print("Tiny SDVRP status:", res.status)
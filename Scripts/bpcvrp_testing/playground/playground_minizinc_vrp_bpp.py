@@ -7,7 +7,7 @@ from bpcvrp_testing.instances.bpp_instance import BPPInstance
 from bpcvrp_testing.instances.vrp_instance import VRPInstance
 from bpcvrp_testing.generators.bpp_generator import generate_random_bpp
 from bpcvrp_testing.generators.vrp_generator import generate_random_vrp
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner
+from bpcvrp_testing.solvers.minizinc_runner import shared_runner
 from bpcvrp_testing.experiments.batch_runner import run_batch, save_results_csv
 
 
@@ -81,7 +81,7 @@ def test_5_bpp_generate_and_solve():
     )
 
     model_path = MODELS_DIR / "bpp_002.mzn"
-    runner = MiniZincRunner(model_path, solver_name="chuffed")
+    runner = shared_runner(model_path, solver_name="chuffed")
 
     res = runner.solve_instance(inst, time_limit=60)
     print("BPP solve status:", res.status)
@@ -107,7 +107,7 @@ def test_6_vrp_generate_and_solve():
     print(str(inst))
 
     model_path = MODELS_DIR / "vrp_002.mzn"
-    runner = MiniZincRunner(model_path, solver_name="chuffed")
+    runner = shared_runner(model_path, solver_name="chuffed")
 
     res = runner.solve_instance(inst, time_limit=120)
     print("VRP solve status:", res.status)
@@ -12,7 +12,7 @@ def test_ortools_bpp_generate_and_solve():
         seed=42,
     )
 
-    runner = ORToolsBPPRunner(solver_name="SCIP")
+    runner = ORToolsBPPRunner()
     res = runner.solve_instance(inst, time_limit=60)
 
     print("ORTools BPP solve status:", res.status)
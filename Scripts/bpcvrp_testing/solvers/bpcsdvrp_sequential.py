@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from math import ceil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from bpcvrp_testing.instances.bpcsdvrp_instance import BPCSDVRPInstance
 from bpcvrp_testing.instances.bpp_instance import BPPInstance
 from bpcvrp_testing.instances.vrp_instance import VRPInstance
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner, SolveResult
+from bpcvrp_testing.solvers.bpp_heuristics import ffd_if_optimal, volume_lower_bound
+from bpcvrp_testing.solvers.minizinc_runner import SolveResult, shared_runner
 
 
 PathLike = Union[str, Path]
@@ -25,6 +28,18 @@ class CustomerPacking:
     bin_of_item: Optional[List[int]]   # list length len(item_sizes), value in 1..pallets
     pallets_items: Optional[List[List[int]]]  # pallet -> list of item indices (1-based)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Like `asdict`, but the lists are shared with the packing, not copied."""
+        return {
+            "customer": self.customer,
+            "item_sizes": self.item_sizes,
+            "pallets": self.pallets,
+            "bpp_status": self.bpp_status,
+            "bpp_time": self.bpp_time,
+            "bin_of_item": self.bin_of_item,
+            "pallets_items": self.pallets_items,
+        }
+
 
 @dataclass
 class GroupingResult:
@@ -41,6 +56,17 @@ class GroupingResult:
     remaining_demands: List[int]
     orig_customer_of_node: List[int]   # index k (1..len(remaining_customers)) -> original customer id
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Like `asdict`, but the lists and dicts are shared, not copied."""
+        return {
+            "fixed_cost": self.fixed_cost,
+            "full_trips": self.full_trips,
+            "full_trip_routes": self.full_trip_routes,
+            "remaining_customers": self.remaining_customers,
+            "remaining_demands": self.remaining_demands,
+            "orig_customer_of_node": self.orig_customer_of_node,
+        }
+
 
 @dataclass
 class GroupedHeuristicSolution:
@@ -54,6 +80,16 @@ class GroupedHeuristicSolution:
     vrp_result: Optional[Dict[str, Any]]
     objective_breakdown: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields (they are already plain dicts/lists)."""
+        return {
+            "packing": self.packing,
+            "grouping": self.grouping,
+            "vrp_instance": self.vrp_instance,
+            "vrp_result": self.vrp_result,
+            "objective_breakdown": self.objective_breakdown,
+        }
+
 
 # -----------------------------
 # Helpers: BPP per customer
@@ -92,6 +128,13 @@ def _reconstruct_pallets(bin_of_item: List[int], pallets: int) -> List[List[int]
     return groups
 
 
+# fallback name -> pallet count used when the BPP solve returns no solution
+_BPP_FALLBACKS: Dict[str, Callable[[List[int], int], int]] = {
+    "items_ub": lambda sizes, cap: len(sizes),  # safe upper bound (one item per pallet)
+    "volume_lb": volume_lower_bound,
+}
+
+
 def solve_bpp_for_customer(
     *,
     customer: int,
@@ -106,10 +149,17 @@ def solve_bpp_for_customer(
     """
     Solve per-customer BPP and return how many pallets are needed.
 
+    If First-Fit-Decreasing already meets the volume lower bound, that packing
+    is optimal and is returned as "FFD_OPTIMAL" without calling MiniZinc.
+
     Fallbacks (used when MiniZinc returns no solution):
       - "items_ub": pallets = number of items (always feasible upper bound)
       - "volume_lb": pallets = ceil(sum / bin_capacity) (lower bound; may be infeasible as a packing)
     """
+    fallback_pallets = _BPP_FALLBACKS.get(fallback)
+    if fallback_pallets is None:
+        raise ValueError(f"Unknown BPP fallback {fallback!r}; expected one of {sorted(_BPP_FALLBACKS)}")
+
     if len(item_sizes) == 0:
         return CustomerPacking(
             customer=customer,
@@ -121,18 +171,28 @@ def solve_bpp_for_customer(
             pallets_items=[],
         )
 
+    ffd_bins = ffd_if_optimal(item_sizes, int(bin_capacity))
+    if ffd_bins is not None:
+        nbins = max(ffd_bins)
+        return CustomerPacking(
+            customer=customer,
+            item_sizes=item_sizes,
+            pallets=nbins,
+            bpp_status="FFD_OPTIMAL",
+            bpp_time=0.0,
+            bin_of_item=ffd_bins,
+            pallets_items=_reconstruct_pallets(ffd_bins, nbins),
+        )
+
     bpp_inst = BPPInstance(n=len(item_sizes), capacity=int(bin_capacity), sizes=[int(x) for x in item_sizes])
 
-    runner = MiniZincRunner(Path(bpp_model_path), solver_name=solver_name)
+    runner = shared_runner(bpp_model_path, solver_name=solver_name)
     res = runner.solve_instance(bpp_inst, time_limit=time_limit, threads=threads)
 
     nbins = _extract_nbins(res)
 
     if nbins is None:
-        if fallback == "volume_lb":
-            nbins = int(ceil(sum(item_sizes) / float(bin_capacity)))
-        else:
-            nbins = len(item_sizes)  # safe upper bound (one item per pallet)
+        nbins = fallback_pallets(item_sizes, int(bin_capacity))
 
         return CustomerPacking(
             customer=customer,
@@ -151,7 +211,7 @@ def solve_bpp_for_customer(
         try:
             # In MiniZinc, b is usually 1-based bin index per item
             raw = res.solution["b"]
-            bin_of_item = [int(v) for v in raw]
+            bin_of_item = list(map(int, raw))
             pallets_items = _reconstruct_pallets(bin_of_item, nbins)
         except Exception:
             bin_of_item = None
@@ -168,6 +228,33 @@ def solve_bpp_for_customer(
     )
 
 
+def _reuse_packing(pack: CustomerPacking, customer: int, item_sizes: List[int]) -> CustomerPacking:
+    """
+    Copy a packing solved for another customer whose items are a permutation of
+    `item_sizes`: items are matched up by size, so the pallets stay feasible.
+    """
+    bin_of_item: Optional[List[int]] = None
+    pallets_items: Optional[List[List[int]]] = None
+
+    if pack.bin_of_item is not None and len(pack.bin_of_item) == len(item_sizes):
+        src_order = sorted(range(len(pack.item_sizes)), key=pack.item_sizes.__getitem__)
+        dst_order = sorted(range(len(item_sizes)), key=item_sizes.__getitem__)
+        bin_of_item = [0] * len(item_sizes)
+        for i, j in zip(src_order, dst_order):
+            bin_of_item[j] = pack.bin_of_item[i]
+        pallets_items = _reconstruct_pallets(bin_of_item, pack.pallets)
+
+    return CustomerPacking(
+        customer=customer,
+        item_sizes=item_sizes,
+        pallets=pack.pallets,
+        bpp_status=pack.bpp_status,
+        bpp_time=0.0,
+        bin_of_item=bin_of_item,
+        pallets_items=pallets_items,
+    )
+
+
 # -----------------------------
 # Stage 2: grouping pallets
 # -----------------------------
@@ -191,55 +278,49 @@ def group_pallet_demands(
     Returns fixed_cost (sum of direct-trip costs) and the remaining customer list + demands.
     """
     Q = int(vehicle_capacity)
+    p = np.asarray(pallet_counts, dtype=np.int64)
+
+    # Customers at or below capacity are routed as they are (index i = customer i+1)
+    routed = p <= Q
+    if treat_equal_capacity_as_fixed:
+        routed &= p != Q
+
+    if Q > 0:
+        trips, rem = np.divmod(p, Q)
+    else:
+        trips, rem = np.zeros_like(p), p.copy()
+    if treat_equal_capacity_as_fixed:
+        # p == Q becomes exactly one full trip
+        exact = (p == Q) & (p != 0)
+        trips[exact] = 1
+        rem[exact] = 0
+    trips[routed] = 0
+    rem[routed] = p[routed]
+
     fixed_cost = 0
     full_trips: Dict[int, int] = {}
     full_trip_routes: List[Dict[str, Any]] = []
 
-    remaining_customers: List[int] = []
-    remaining_demands: List[int] = []
-    orig_customer_of_node: List[int] = []
-
-    # pallet_counts indexed by customer-1 (customers are 1..N)
-    for c_idx_0, p in enumerate(pallet_counts):
+    for c_idx_0 in np.flatnonzero(trips > 0).tolist():
         c = c_idx_0 + 1
-
-        if p <= Q and not (treat_equal_capacity_as_fixed and p == Q):
-            if p > 0:
-                remaining_customers.append(c)
-                remaining_demands.append(int(p))
-                orig_customer_of_node.append(c)
-            continue
-
-        # p > Q, or p == Q and we treat it as fixed
-        if p == 0:
-            continue
-
-        trips = p // Q if Q > 0 else 0
-        rem = p % Q if Q > 0 else p
-
-        # If p == Q and treat_equal_capacity_as_fixed: trips = 1, rem = 0
-        if treat_equal_capacity_as_fixed and p == Q:
-            trips = 1
-            rem = 0
-
-        if trips > 0:
-            # distance matrix uses index 0 = depot, 1..N = customers
-            trip_cost = int(distance[0][c]) + int(distance[c][0])
-            fixed_cost += trips * trip_cost
-            full_trips[c] = trips
-            full_trip_routes.append({
-                "customer": c,
-                "trips": trips,
-                "pallets_per_trip": Q,
-                "trip_cost": trip_cost,
-                "total_cost": trips * trip_cost,
-                "route": [0, c, 0],
-            })
-
-        if rem > 0:
-            remaining_customers.append(c)
-            remaining_demands.append(int(rem))
-            orig_customer_of_node.append(c)
+        t = int(trips[c_idx_0])
+        # distance matrix uses index 0 = depot, 1..N = customers
+        trip_cost = int(distance[0][c]) + int(distance[c][0])
+        fixed_cost += t * trip_cost
+        full_trips[c] = t
+        full_trip_routes.append({
+            "customer": c,
+            "trips": t,
+            "pallets_per_trip": Q,
+            "trip_cost": trip_cost,
+            "total_cost": t * trip_cost,
+            "route": [0, c, 0],
+        })
+
+    kept = np.flatnonzero(rem > 0)
+    remaining_customers: List[int] = (kept + 1).tolist()
+    remaining_demands: List[int] = rem[kept].tolist()
+    orig_customer_of_node: List[int] = list(remaining_customers)
 
     return GroupingResult(
         fixed_cost=int(fixed_cost),
@@ -269,10 +350,8 @@ def build_reduced_vrp_instance(
     nodes = [0] + [int(c) for c in remaining_customers]  # original ids, depot first
     N_rem = len(remaining_customers)
 
-    dist: List[List[int]] = []
-    for i in nodes:
-        row = [int(original_distance[i][j]) for j in nodes]
-        dist.append(row)
+    D = np.asarray(original_distance, dtype=np.int64)
+    dist: List[List[int]] = D[np.ix_(nodes, nodes)].tolist()
 
     return VRPInstance(
         N=N_rem,
@@ -297,6 +376,7 @@ def solve_bpcsdvrp_grouped_heuristic(
     time_limit_vrp: Optional[float] = None,
     treat_equal_capacity_as_fixed: bool = False,
     fallback_bpp: str = "items_ub",
+    bpp_workers: int = 1,
 ) -> SolveResult:
     """
     Sequential pallet-grouping heuristic:
@@ -310,6 +390,10 @@ def solve_bpcsdvrp_grouped_heuristic(
 
     Total runtime is measured from the start of the first BPP solve until the end of the VRP solve.
     The returned SolveResult.solution includes packing + grouping + VRP output.
+
+    The per-customer BPPs are independent: with bpp_workers > 1 up to that many
+    are solved at once, and `threads` is split between them so the stage still
+    uses about `threads` cores. The VRP stage always gets all `threads`.
     """
     t0 = perf_counter()
 
@@ -317,22 +401,47 @@ def solve_bpcsdvrp_grouped_heuristic(
     packing_rows: List[CustomerPacking] = []
     pallet_counts: List[int] = []
 
+    sizes_by_customer: Dict[int, List[int]] = {}
     for c in range(1, inst.N + 1):
         k = int(inst.ItemsPerCustomer[c - 1])
-        sizes_row = [int(x) for x in inst.SizesOfItems[c - 1][:k] if int(x) > 0]
+        sizes_by_customer[c] = [x for x in map(int, inst.SizesOfItems[c - 1][:k]) if x > 0]
+
+    # Customers whose items are a permutation of each other share one BPP solve.
+    solved_by: Dict[Tuple[int, ...], int] = {}
+    for c, sizes_row in sizes_by_customer.items():
+        solved_by.setdefault(tuple(sorted(sizes_row)), c)
+    to_solve = list(solved_by.values())
+
+    bpp_workers = max(1, min(int(bpp_workers), len(to_solve)))
+    bpp_threads = threads
+    if threads is not None and bpp_workers > 1:
+        bpp_threads = max(1, int(threads) // bpp_workers)
 
-        pack = solve_bpp_for_customer(
+    def solve_customer(c: int) -> CustomerPacking:
+        return solve_bpp_for_customer(
             customer=c,
-            item_sizes=sizes_row,
+            item_sizes=sizes_by_customer[c],
             bin_capacity=int(inst.binCapacity),
             bpp_model_path=bpp_model_path,
             solver_name=solver_name,
             time_limit=time_limit_bpp_per_customer,
-            threads=threads,
+            threads=bpp_threads,
             fallback=fallback_bpp,
         )
+
+    if bpp_workers > 1:
+        # Each solve is a MiniZinc subprocess, so threads are enough; map keeps customer order.
+        with ThreadPoolExecutor(max_workers=bpp_workers) as pool:
+            solved = dict(zip(to_solve, pool.map(solve_customer, to_solve)))
+    else:
+        solved = {c: solve_customer(c) for c in to_solve}
+
+    for c, sizes_row in sizes_by_customer.items():
+        pack = solved.get(c)
+        if pack is None:
+            pack = _reuse_packing(solved[solved_by[tuple(sorted(sizes_row))]], c, sizes_row)
         packing_rows.append(pack)
-        pallet_counts.append(int(pack.pallets))
+    pallet_counts.extend(int(pack.pallets) for pack in packing_rows)
 
     # Stage 2: group pallets + compute fixed cost
     grouping = group_pallet_demands(
@@ -356,7 +465,7 @@ def solve_bpcsdvrp_grouped_heuristic(
             remaining_demands=grouping.remaining_demands,
             vehicle_capacity=int(inst.Capacity),
         )
-        vrp_runner = MiniZincRunner(Path(vrp_model_path), solver_name=solver_name)
+        vrp_runner = shared_runner(vrp_model_path, solver_name=solver_name)
         vrp_res = vrp_runner.solve_instance(vrp_inst, time_limit=time_limit_vrp, threads=threads)
 
         if vrp_res.has_solution and vrp_res.objective is not None:
@@ -365,8 +474,8 @@ def solve_bpcsdvrp_grouped_heuristic(
             # Propagate failure from VRP stage
             t1 = perf_counter()
             sol = GroupedHeuristicSolution(
-                packing=[asdict(p) for p in packing_rows],
-                grouping=asdict(grouping),
+                packing=[p.to_dict() for p in packing_rows],
+                grouping=grouping.to_dict(),
                 vrp_instance=vrp_inst.to_dict() if vrp_inst else None,
                 vrp_result={
                     "status": vrp_res.status,
@@ -385,7 +494,7 @@ def solve_bpcsdvrp_grouped_heuristic(
                 status=vrp_res.status if vrp_res else "UNKNOWN",
                 has_solution=False,
                 objective=None,
-                solution=asdict(sol),
+                solution=sol.to_dict(),
                 time=float(t1 - t0),
                 raw_result={"packing": packing_rows, "grouping": grouping, "vrp_result": vrp_res},
             )
@@ -395,8 +504,8 @@ def solve_bpcsdvrp_grouped_heuristic(
     t1 = perf_counter()
 
     sol = GroupedHeuristicSolution(
-        packing=[asdict(p) for p in packing_rows],
-        grouping=asdict(grouping),
+        packing=[p.to_dict() for p in packing_rows],
+        grouping=grouping.to_dict(),
         vrp_instance=vrp_inst.to_dict() if vrp_inst else None,
         vrp_result={
             "status": vrp_res.status,
@@ -417,7 +526,7 @@ def solve_bpcsdvrp_grouped_heuristic(
         status=(vrp_res.status if vrp_res is not None else "SATISFIED"),
         has_solution=True,
         objective=total_objective,
-        solution=asdict(sol),
+        solution=sol.to_dict(),
         time=float(t1 - t0),
         raw_result={"packing": packing_rows, "grouping": grouping, "vrp_result": vrp_res},
     )
@@ -438,14 +547,18 @@ def run_grouped_heuristic_over_seeds(
     time_limit_vrp: Optional[float] = None,
     treat_equal_capacity_as_fixed: bool = False,
     fallback_bpp: str = "items_ub",
+    bpp_workers: int = 1,
+    max_workers: Optional[int] = None,
 ) -> List[SolveResult]:
     """
     Convenience wrapper when you already have a list of instances generated with different seeds.
     Returns a list of SolveResults (one per instance), with timing measured per instance.
+
+    With max_workers > 1, that many instances are solved at once (results keep the
+    input order); keep `max_workers * threads` at or below the number of cores.
     """
-    results: List[SolveResult] = []
-    for inst in instances:
-        res = solve_bpcsdvrp_grouped_heuristic(
+    def solve(inst: BPCSDVRPInstance) -> SolveResult:
+        return solve_bpcsdvrp_grouped_heuristic(
             inst=inst,
             bpp_model_path=bpp_model_path,
             vrp_model_path=vrp_model_path,
@@ -455,6 +568,12 @@ def run_grouped_heuristic_over_seeds(
             time_limit_vrp=time_limit_vrp,
             treat_equal_capacity_as_fixed=treat_equal_capacity_as_fixed,
             fallback_bpp=fallback_bpp,
+            bpp_workers=bpp_workers,
         )
-        results.append(res)
-    return results
+
+    if max_workers is None or max_workers <= 1:
+        return [solve(inst) for inst in instances]
+
+    # Solves are MiniZinc subprocesses, so a thread pool runs them in parallel.
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(solve, instances))
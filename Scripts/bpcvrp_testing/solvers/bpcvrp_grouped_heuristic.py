@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner, SolveResult
+import numpy as np
+
+from bpcvrp_testing.solvers.bpp_heuristics import ffd_if_optimal, volume_lower_bound
+from bpcvrp_testing.solvers.minizinc_runner import MiniZincRunner, SolveResult, shared_runner
 from bpcvrp_testing.instances.grouped_vrp_instance import GroupedVRPInstance
 
 PathLike = Union[str, Path]
 
+# Solver threads for the palletisation stage (split between parallel BPP solves)
+BPP_THREADS = 24
+
 
-@dataclass
+@dataclass(slots=True)
 class PalletisationStats:
     pallets_per_customer: List[int]                 # p_c
     full_trips_per_customer: List[int]              # floor(p_c / Capacity)
@@ -21,7 +26,7 @@ class PalletisationStats:
     remaining_demands: List[int]                    # demand for each remaining node (same order)
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupedHeuristicResult:
     """
     Result of the heuristic pipeline:
@@ -55,7 +60,7 @@ def _extract_bpp_objective(res: SolveResult) -> Optional[int]:
     Robustly extract number of pallets from a BPP solve result.
 
     Accepts either:
-      - res.objective (preferred)
+      - res.objective (preferred; the only one set with want_solution=False)
       - solution['nBins']  (common in your BPP model)
       - solution['objective'] (if you used an explicit objective var)
     """
@@ -72,15 +77,39 @@ def _extract_bpp_objective(res: SolveResult) -> Optional[int]:
     return None
 
 
+# fallback name -> pallet count used when the BPP solve fails
+_BPP_FALLBACKS: Dict[str, Callable[[List[int], int], int]] = {
+    "volume_lb": volume_lower_bound,
+    "worst": lambda sizes, cap: len(sizes),  # one item per pallet
+}
+
+
+def _bpp_fallback(fallback: str) -> Callable[[List[int], int], int]:
+    fallback_pallets = _BPP_FALLBACKS.get(fallback)
+    if fallback_pallets is None:
+        raise ValueError(f"Unknown BPP fallback {fallback!r}; expected one of {sorted(_BPP_FALLBACKS)}")
+    return fallback_pallets
+
+
+def _bpp_data(sizes: List[int], bin_capacity: int) -> Dict[str, Any]:
+    return {
+        "n": len(sizes),
+        "capacity": int(bin_capacity),
+        "size": list(sizes),
+    }
+
+
 def solve_bpp_for_customer(
     bpp_runner: MiniZincRunner,
     sizes: Sequence[int],
     bin_capacity: int,
     time_limit: Optional[float] = None,
     fallback: str = "volume_lb",
+    threads: Optional[int] = BPP_THREADS,
 ) -> int:
     """
     Solve the 1D bin packing model for a single customer order.
+    Skipped when First-Fit-Decreasing already meets the volume lower bound.
 
     Parameters
     ----------
@@ -97,28 +126,25 @@ def solve_bpp_for_customer(
     -------
     int: number of pallets (bins) used.
     """
-    sizes = [int(s) for s in sizes if int(s) > 0]
+    fallback_pallets = _bpp_fallback(fallback)
+
+    sizes = [s for s in map(int, sizes) if s > 0]
     if not sizes:
         return 0
 
-    data = {
-        "n": len(sizes),
-        "capacity": int(bin_capacity),
-        "size": list(sizes),
-    }
+    ffd_bins = ffd_if_optimal(sizes, int(bin_capacity))
+    if ffd_bins is not None:
+        # FFD meets the volume lower bound: optimal, no solve needed
+        return max(ffd_bins)
 
-    res = bpp_runner.solve(data, time_limit=time_limit, threads=24)
+    # only the pallet count is used
+    res = bpp_runner.solve(_bpp_data(sizes, bin_capacity), time_limit=time_limit, threads=threads, want_solution=False)
     pallets = _extract_bpp_objective(res)
 
     if pallets is not None:
         return pallets
 
-    # fallback
-    if fallback == "worst":
-        return len(sizes)
-
-    # default: volume lower bound
-    return int(ceil(sum(sizes) / float(bin_capacity)))
+    return fallback_pallets(sizes, int(bin_capacity))
 
 
 def palletise_and_group(
@@ -132,50 +158,70 @@ def palletise_and_group(
     solver_name: str = "cp-sat",
     time_limit_per_customer: Optional[float] = None,
     fallback: str = "volume_lb",
+    max_workers: Optional[int] = None,
 ) -> PalletisationStats:
     """
     Run BPP per customer, then group pallets into:
       - full trips of size Capacity (counted into fixedCost)
       - one remainder node (if remainder > 0)
 
+    The distinct BPPs that First-Fit-Decreasing cannot settle go to the runner's
+    solve_many; with max_workers > 1, up to that many are solved at once and
+    the BPP_THREADS solver threads are split between them.
+
     Returns stats plus the reduced node list and demands.
     """
-    bpp_runner = MiniZincRunner(bpp_model_path, solver_name=solver_name)
-
-    pallets_per_customer: List[int] = []
-    full_trips_per_customer: List[int] = []
-    remainder_per_customer: List[int] = []
-
-    fixed_cost = 0
-    remaining_customer_ids: List[int] = []
-    remaining_demands: List[int] = []
+    fallback_pallets = _bpp_fallback(fallback)
+    bpp_runner = shared_runner(bpp_model_path, solver_name=solver_name)
 
+    # The pallet count depends only on the multiset of item sizes: customers with
+    # the same sorted sizes share one BPP solve.
+    keys: List[Tuple[int, ...]] = []
     for c in range(1, N + 1):
         k = int(ItemsPerCustomer[c - 1])
-        row = list(SizesOfItems[c - 1])[:k]
-        pallets = solve_bpp_for_customer(
-            bpp_runner=bpp_runner,
-            sizes=row,
-            bin_capacity=binCapacity,
-            time_limit=time_limit_per_customer,
-            fallback=fallback,
-        )
+        keys.append(tuple(sorted(s for s in map(int, SizesOfItems[c - 1][:k]) if s > 0)))
+    unique_keys = list(dict.fromkeys(keys))
+
+    pallets_by_key: Dict[Tuple[int, ...], int] = {}
+    to_solve: List[Tuple[int, ...]] = []
+    for key in unique_keys:
+        if not key:
+            pallets_by_key[key] = 0
+            continue
+        ffd_bins = ffd_if_optimal(key, int(binCapacity))
+        if ffd_bins is not None:
+            # FFD meets the volume lower bound: optimal, no solve needed
+            pallets_by_key[key] = max(ffd_bins)
+        else:
+            to_solve.append(key)
+
+    parallel = max_workers is not None and max_workers > 1
+    results = bpp_runner.solve_many(
+        [_bpp_data(list(key), binCapacity) for key in to_solve],
+        time_limit=time_limit_per_customer,
+        max_workers=max_workers,
+        threads=max(1, BPP_THREADS // max_workers) if parallel else BPP_THREADS,
+        want_solution=False,  # only the pallet count is used
+    )
+    for key, res in zip(to_solve, results):
+        pallets = _extract_bpp_objective(res)
+        pallets_by_key[key] = pallets if pallets is not None else fallback_pallets(list(key), int(binCapacity))
 
-        pallets_per_customer.append(pallets)
+    pallets = np.fromiter((pallets_by_key[key] for key in keys), dtype=np.int64, count=N)
+    full_trips, rem = np.divmod(pallets, Capacity)
 
-        full_trips = pallets // Capacity
-        rem = pallets % Capacity
-        full_trips_per_customer.append(full_trips)
-        remainder_per_customer.append(rem)
+    # each full trip is depot -> customer -> depot
+    # Distance matrix convention: row/col 0 is depot, 1..N are customers
+    depot_row = np.asarray(Distance[0][1:N + 1], dtype=np.int64)
+    fixed_cost = int(2 * np.dot(full_trips, depot_row))
 
-        if full_trips > 0:
-            # each full trip is depot -> customer -> depot
-            # Distance matrix convention: row/col 0 is depot, 1..N are customers
-            fixed_cost += full_trips * (2 * int(Distance[0][c]))
+    kept = np.flatnonzero(rem > 0)
 
-        if rem > 0:
-            remaining_customer_ids.append(c)
-            remaining_demands.append(rem)
+    pallets_per_customer: List[int] = pallets.tolist()
+    full_trips_per_customer: List[int] = full_trips.tolist()
+    remainder_per_customer: List[int] = rem.tolist()
+    remaining_customer_ids: List[int] = (kept + 1).tolist()
+    remaining_demands: List[int] = rem[kept].tolist()
 
     return PalletisationStats(
         pallets_per_customer=pallets_per_customer,
@@ -212,9 +258,8 @@ def build_grouped_vrp_instance(
     # indices in the original matrix: 0 = depot, customer c is index c
     idx = [0] + remaining_customer_ids
 
-    Distance_rem: List[List[int]] = []
-    for i in idx:
-        Distance_rem.append([int(original_distance[i][j]) for j in idx])
+    D = np.asarray(original_distance, dtype=np.int64)
+    Distance_rem: List[List[int]] = D[np.ix_(idx, idx)].tolist()
 
     return GroupedVRPInstance(
         N=N_rem,
@@ -240,7 +285,7 @@ def solve_grouped_orders_vrp(
     The MiniZinc model is expected to accept:
       N, Capacity, nbVehicles, Demand, Distance, fixedCost
     """
-    runner = MiniZincRunner(vrp_model_path, solver_name=solver_name)
+    runner = shared_runner(vrp_model_path, solver_name=solver_name)
     return runner.solve_instance(grouped_instance, time_limit=time_limit, threads=24)
 
 
@@ -253,6 +298,7 @@ def solve_bpcvrp_grouped_heuristic(
     time_limit_vrp: Optional[float] = None,
     fallback: str = "volume_lb",
     nbVehicles: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> GroupedHeuristicResult:
     """
     End-to-end heuristic:
@@ -267,6 +313,8 @@ def solve_bpcvrp_grouped_heuristic(
 
     `nbVehicles`:
       - if None, uses N_remaining as a safe upper bound (same as your CVRP model style).
+
+    `max_workers` is passed on to `palletise_and_group`.
     """
     N = int(instance_obj.N)
     Capacity = int(instance_obj.Capacity)
@@ -286,6 +334,7 @@ def solve_bpcvrp_grouped_heuristic(
         solver_name=solver_name,
         time_limit_per_customer=time_limit_per_customer,
         fallback=fallback,
+        max_workers=max_workers,
     )
 
     # If everything became a fixed full-trip, no VRP remains.
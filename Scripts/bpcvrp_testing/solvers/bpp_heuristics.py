@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+
+def volume_lower_bound(sizes: Sequence[int], capacity: int) -> int:
+    """ceil(sum(sizes) / capacity): no packing can use fewer bins."""
+    return -(-sum(sizes) // int(capacity))
+
+
+def first_fit_decreasing(sizes: Sequence[int], capacity: int) -> List[int]:
+    """
+    First-Fit-Decreasing packing.
+
+    Returns the bin of each item in input order (1-based), like the `b`
+    output of the BPP models. Items larger than `capacity` get a bin of their own.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
+    loads: List[int] = []
+    bin_of_item = [0] * len(sizes)
+    for i in order:
+        s = sizes[i]
+        for b, load in enumerate(loads):
+            if load + s <= capacity:
+                loads[b] = load + s
+                bin_of_item[i] = b + 1
+                break
+        else:
+            loads.append(s)
+            bin_of_item[i] = len(loads)
+    return bin_of_item
+
+
+def ffd_if_optimal(sizes: Sequence[int], capacity: int) -> Optional[List[int]]:
+    """
+    The FFD packing of `sizes` if it is provably optimal, i.e. it meets the
+    volume lower bound; None otherwise (the BPP then needs an exact solve).
+    """
+    if not sizes or max(sizes) > capacity:
+        return None
+    bin_of_item = first_fit_decreasing(sizes, capacity)
+    if max(bin_of_item) == volume_lower_bound(sizes, capacity):
+        return bin_of_item
+    return None
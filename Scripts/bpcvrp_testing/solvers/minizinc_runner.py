@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+import atexit
+import threading
 import time
 import datetime as dt
 
@@ -13,7 +17,19 @@ import minizinc
 PathLike = Union[str, Path]
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _lookup_solver(solver_name: str) -> minizinc.Solver:
+    """`Solver.lookup` shells out to `minizinc --solvers-json`; do it once per solver."""
+    return minizinc.Solver.lookup(solver_name)
+
+
+@lru_cache(maxsize=None)
+def _load_model(model_path: str) -> minizinc.Model:
+    """Parse each model file once and share it between runners."""
+    return minizinc.Model(model_path)
+
+
+@dataclass(slots=True)
 class SolveResult:
     """Unified result of running a MiniZinc model.
 
@@ -48,9 +64,45 @@ class MiniZincRunner:
         if not self.model_path.is_file():
             raise FileNotFoundError(f"Model file not found: {self.model_path}")
 
-        self.model = minizinc.Model(str(self.model_path))
-        self.solver = minizinc.Solver.lookup(solver_name)
+        self.model = _load_model(str(self.model_path.resolve()))
+        self.solver = _lookup_solver(solver_name)
+
+        # One analysed base instance per thread; solves branch off it so the
+        # model interface is not re-analysed for every data set.
+        self._local = threading.local()
+
+        # solve_many thread pools, one per worker count. They are kept between
+        # calls so their threads, and the base instance each thread analysed,
+        # are reused; close() shuts them down (also registered with atexit).
+        self._pools: Dict[int, ThreadPoolExecutor] = {}
+        self._pools_lock = threading.Lock()
+        self._atexit_registered = False
+
+    def _base_instance(self) -> minizinc.Instance:
+        base = getattr(self._local, "instance", None)
+        if base is None:
+            base = minizinc.Instance(self.solver, self.model)
+            self._local.instance = base
+        return base
+
+    def _pool(self, max_workers: int) -> ThreadPoolExecutor:
+        with self._pools_lock:
+            pool = self._pools.get(max_workers)
+            if pool is None:
+                if not self._atexit_registered:
+                    atexit.register(self.close)
+                    self._atexit_registered = True
+                pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="minizinc-runner")
+                self._pools[max_workers] = pool
+            return pool
 
+    def close(self) -> None:
+        """Shut down the `solve_many` worker threads; they are recreated on demand."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=True)
 
     def solve(
         self,
@@ -59,6 +111,7 @@ class MiniZincRunner:
         all_solutions: bool = False,
         free_search: bool = False,
         threads: Optional[int] = None,
+        want_solution: bool = True,
         **kwargs: Any,
     ) -> SolveResult:
         """Run the model for the given input data.
@@ -75,6 +128,8 @@ class MiniZincRunner:
             Whether to request all solutions (mainly for SAT-like models).
         free_search: bool
             Allow the solver to ignore the model's search strategy.
+        want_solution: bool
+            If False, only status and objective are filled in (`solution` is None).
         **kwargs:
             Additional keyword arguments passed to `Instance.solve()`.
 
@@ -83,11 +138,6 @@ class MiniZincRunner:
         SolveResult
             Contains status, has_solution flag, objective value, solution dict and elapsed time.
         """
-        inst = minizinc.Instance(self.solver, self.model)
-
-        for name, value in data.items():
-            inst[name] = value
-
         tl: Optional[dt.timedelta] = None
         if time_limit is not None:
             tl = dt.timedelta(seconds=float(time_limit))
@@ -95,14 +145,18 @@ class MiniZincRunner:
         if threads is not None:
             kwargs["processes"] = int(threads)
 
-        start = time.perf_counter()
-        result = inst.solve(
-            time_limit=tl,
-            all_solutions=all_solutions,
-            free_search=free_search,
-            **kwargs,
-        )
-        end = time.perf_counter()
+        with self._base_instance().branch() as inst:
+            for name, value in data.items():
+                inst[name] = value
+
+            start = time.perf_counter()
+            result = inst.solve(
+                time_limit=tl,
+                all_solutions=all_solutions,
+                free_search=free_search,
+                **kwargs,
+            )
+            end = time.perf_counter()
 
         elapsed = end - start
 
@@ -120,18 +174,17 @@ class MiniZincRunner:
 
         objective: Optional[float] = None
         if has_solution:
-            if hasattr(sol_obj, "objective"):
-                objective = float(getattr(sol_obj, "objective"))
-            else:
+            obj_val = getattr(sol_obj, "objective", None)
+            if obj_val is None:
                 try:
                     obj_val = result["objective"]
-                    if obj_val is not None:
-                        objective = float(obj_val)
                 except Exception:
-                    objective = None
+                    obj_val = None
+            if obj_val is not None:
+                objective = float(obj_val)
 
         sol_dict: Optional[Dict[str, Any]] = None
-        if has_solution:
+        if has_solution and want_solution:
             raw = vars(sol_obj)
             sol_dict = {
                 k: v for k, v in raw.items()
@@ -147,6 +200,26 @@ class MiniZincRunner:
             raw_result=result,
         )
 
+    def solve_many(
+        self,
+        data_list: Sequence[Dict[str, Any]],
+        time_limit: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[SolveResult]:
+        """Solve the model for several data sets; results are in input order.
+
+        With max_workers > 1, up to that many solves run at once. Each solve is a
+        MiniZinc subprocess, so a thread pool is enough; the pool is kept on the
+        runner, so repeated calls reuse its threads and their base instances.
+        Other arguments go to `solve()`.
+        """
+        if max_workers is None or max_workers <= 1 or len(data_list) <= 1:
+            return [self.solve(data, time_limit=time_limit, **kwargs) for data in data_list]
+
+        pool = self._pool(max_workers)
+        return list(pool.map(lambda data: self.solve(data, time_limit=time_limit, **kwargs), data_list))
+
     def solve_instance(
         self,
         instance_obj: Any,
@@ -169,4 +242,19 @@ class MiniZincRunner:
             all_solutions=all_solutions,
             free_search=free_search,
             **kwargs,
-        )
\ No newline at end of file
+        )
+
+
+@lru_cache(maxsize=None)
+def _shared_runner(model_path: str, solver_name: str) -> MiniZincRunner:
+    return MiniZincRunner(model_path, solver_name=solver_name)
+
+
+def shared_runner(model_path: PathLike, solver_name: str = "chuffed") -> MiniZincRunner:
+    """Process-wide MiniZincRunner for (model file, solver).
+
+    Helpers that solve one small model per customer or per call should use this
+    instead of building a new runner each time; a runner is safe to share
+    between threads (each thread gets its own base instance).
+    """
+    return _shared_runner(str(Path(model_path).resolve()), solver_name)
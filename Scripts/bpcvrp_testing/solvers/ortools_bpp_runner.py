@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 import time
-from typing import Any, Dict, Optional
+import warnings
+from typing import Any, Dict, List, Optional
 from bpcvrp_testing.instances.bpp_instance import BPPInstance
-from ortools.linear_solver import pywraplp
+from bpcvrp_testing.solvers.bpp_heuristics import ffd_if_optimal, first_fit_decreasing
+from ortools.sat.python import cp_model
 
 
-@dataclass
+@dataclass(slots=True)
 class SolveResult:
     status: str
     has_solution: bool
@@ -16,56 +18,100 @@ class SolveResult:
 
 
 class ORToolsBPPRunner:
-    def __init__(self, solver_name: str = "SCIP"):
-        self.solver_name = solver_name
+    def __init__(self, solver_name: Optional[str] = None, num_workers: Optional[int] = None):
+        # The model is always solved with CP-SAT; solver_name is kept so older
+        # callers (e.g. ORToolsBPPRunner("SCIP")) keep working.
+        if solver_name is not None and solver_name.upper() not in ("CP-SAT", "CP_SAT", "SAT"):
+            warnings.warn(
+                f"ORToolsBPPRunner(solver_name={solver_name!r}) is deprecated and ignored; CP-SAT is always used",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self.solver_name = "CP-SAT"
+        self.num_workers = num_workers
 
     def solve(self, data: Dict[str, Any], time_limit: Optional[float] = None) -> SolveResult:
-        solver = pywraplp.Solver.CreateSolver(self.solver_name)
+        start = time.perf_counter()
+        ffd_bins = ffd_if_optimal(data["weights"], data["bin_capacity"])
+        if ffd_bins is not None:
+            # FFD meets the volume lower bound: optimal, no solve needed
+            bin_items: Dict[int, List[int]] = {}
+            for i, b in enumerate(ffd_bins):
+                bin_items.setdefault(b - 1, []).append(i)
+            return SolveResult(
+                status="OPTIMAL",
+                has_solution=True,
+                objective=float(max(ffd_bins)),
+                solution={"bin_items": dict(sorted(bin_items.items()))},
+                time=time.perf_counter() - start,
+                raw_result=None,
+            )
+
+        model = cp_model.CpModel()
+
+        items = range(data["items"])
+        # First-Fit-Decreasing gives a feasible packing, so no more bins are needed.
+        ffd = first_fit_decreasing(data["weights"], data["bin_capacity"])
+        bins = range(min(data["bins"], max(ffd, default=0)))
+        # Position of each item when sorted by decreasing weight (stable, as in FFD)
+        rank = {i: r for r, i in enumerate(sorted(items, key=lambda i: -data["weights"][i]))}
 
-        if not solver:
-            return
-        
         # Variables
         # x[i, j] = 1 if item i is packed in bin j.
+        # Symmetry breaking: the item of rank r goes to one of the bins 0..r.
         x = {}
-        for i in range(data["items"]):
-            for j in range(data["bins"]):
-                x[(i, j)] = solver.IntVar(0, 1, "x_%i_%i" % (i, j))
+        for i in items:
+            for j in bins:
+                if j <= rank[i]:
+                    x[(i, j)] = model.NewBoolVar("x_%i_%i" % (i, j))
 
         # y[j] = 1 if bin j is used.
         y = {}
-        for j in range(data["bins"]):
-            y[j] = solver.IntVar(0, 1, "y[%i]" % j)
+        for j in bins:
+            y[j] = model.NewBoolVar("y[%i]" % j)
 
         # Constraints
         # Each item must be in exactly one bin.
-        for i in range(data["items"]):
-            solver.Add(sum(x[i, j] for j in range(data["bins"])) == 1)
+        for i in items:
+            model.AddExactlyOne(x[i, j] for j in bins if j <= rank[i])
 
         # The amount packed in each bin cannot exceed its capacity.
-        for j in range(data["bins"]):
-            solver.Add(
-                sum(x[(i, j)] * data["weights"][i] for i in range(data["items"]))
+        for j in bins:
+            model.Add(
+                sum(x[(i, j)] * data["weights"][i] for i in items if j <= rank[i])
                 <= y[j] * data["bin_capacity"]
             )
 
+        # Symmetry breaking: the used bins are 0..k-1.
+        for j in bins[1:]:
+            model.Add(y[j - 1] >= y[j])
+
+        # Start from the FFD packing; it satisfies both symmetry-breaking rules.
+        for (i, j), var in x.items():
+            model.AddHint(var, ffd[i] - 1 == j)
+        for j in bins:
+            model.AddHint(y[j], True)
+
         # Objective: minimize the number of bins used.
-        solver.Minimize(solver.Sum([y[j] for j in range(data["bins"])]))
+        model.Minimize(sum(y[j] for j in bins))
 
+        solver = cp_model.CpSolver()
         if time_limit is not None:
-            solver.SetTimeLimit(int(1000 * time_limit))
+            solver.parameters.max_time_in_seconds = float(time_limit)
+        if self.num_workers is not None:
+            solver.parameters.num_workers = int(self.num_workers)
 
-        status_code = solver.Solve()
-        status_str = self._decode_status(status_code)
-        has_solution = status_code == pywraplp.Solver.OPTIMAL or status_code == pywraplp.Solver.FEASIBLE
+        status_code = solver.Solve(model)
+        status_str = solver.StatusName(status_code)
+        has_solution = status_code == cp_model.OPTIMAL or status_code == cp_model.FEASIBLE
 
-        objective = solver.Objective().Value() if has_solution else None
+        objective = solver.ObjectiveValue() if has_solution else None
         solution_dict = {}
 
         if has_solution:
             solution_dict["bin_items"] = {
-                j: [i for i in range(data["items"]) if x[i, j].solution_value() > 0.5]
-                for j in range(data["bins"]) if y[j].solution_value() > 0.5
+                j: [i for i in items if j <= rank[i] and solver.BooleanValue(x[i, j])]
+                for j in bins if solver.BooleanValue(y[j])
             }
 
         return SolveResult(
@@ -73,21 +119,9 @@ class ORToolsBPPRunner:
             has_solution=has_solution,
             objective=objective,
             solution=solution_dict,
-            time=solver.WallTime() / 1000,
+            time=solver.WallTime(),
             raw_result=solver,
         )
     
     def solve_instance(self, instance_obj: BPPInstance, time_limit: Optional[float] = None) -> SolveResult:
         return self.solve(instance_obj.to_ortools(), time_limit=time_limit)
-    
-    def _decode_status(self, code: int) -> str:
-        status_map = {
-            pywraplp.Solver.OPTIMAL: "OPTIMAL",
-            pywraplp.Solver.FEASIBLE: "FEASIBLE",
-            pywraplp.Solver.INFEASIBLE: "INFEASIBLE",
-            pywraplp.Solver.UNBOUNDED: "UNBOUNDED",
-            pywraplp.Solver.ABNORMAL: "ABNORMAL",
-            pywraplp.Solver.NOT_SOLVED: "NOT_SOLVED",
-        }
-        return status_map.get(code, f"UNKNOWN({code})")
-        
\ No newline at end of file